@@ -4,5 +4,9 @@ set -o errexit
 pip install --upgrade pip
 pip install -r requirements.txt
 
+# Vendor + minify CSS bundles, phir collectstatic fingerprint/compress karega
+python manage.py build_assets --strict
 python manage.py collectstatic --noinput
 python manage.py migrate --noinput
+# Purane attachments (file_kind khali) ka meta bharo; bhare hue rows skip hote hain
+python manage.py backfill_attachment_meta
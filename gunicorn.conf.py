@@ -0,0 +1,44 @@
+# Gunicorn config. Start command sirf `gunicorn` rakho (Render pe bhi):
+# positional app (`gunicorn helpdesk.wsgi`) neeche wale wsgi_app ko override
+# kar deta hai aur GUNICORN_ASGI ka koi asar nahi rehta.
+# gunicorn ise working directory se khud load karta hai.
+import multiprocessing
+import os
+
+# Warm-up sirf server process me chale, manage.py commands me nahi
+os.environ.setdefault("DJANGO_WARMUP", "true")
+
+wsgi_app = "helpdesk.wsgi:application"
+# Live comments (SSE) ke liye ASGI chahiye: GUNICORN_ASGI=true -> uvicorn workers
+if os.getenv("GUNICORN_ASGI", "false").lower() == "true":
+    wsgi_app = "helpdesk.asgi:application"
+    worker_class = "uvicorn.workers.UvicornWorker"
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+# Threads (gthread) ke bina har worker ek hi request chalata hai aur
+# BULKHEADS caps (per process) kuch nahi karte; slow ai/SMTP requests apne
+# cap tak hi threads lete hain, baaki threads sasti pages serve karte rehte hain
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+
+# Fast startup: app master me ek baar import + warm hota hai (MainConfig.ready),
+# workers fork hoke warm copy le lete hain (copy-on-write memory bhi bachti hai)
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() == "true"
+
+# Worker recycle thoda jitter ke saath, taaki sab ek saath cold na hon
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+accesslog = "-"
+
+
+def post_fork(server, worker):
+    # DB/cache sockets fork ke across share nahi hone chahiye:
+    # master wale band karo, worker apne fresh khole
+    from main import warmup
+
+    warmup.close_db_connections()
+    # DB warm-up sirf sync worker (threads=1) me kaam ka hai, see warm_up_worker
+    sync_worker = server.cfg.threads <= 1 and server.cfg.worker_class_str == "sync"
+    warmup.warm_up_worker(db=sync_worker)
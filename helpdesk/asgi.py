@@ -2,6 +2,8 @@
 ASGI config for helpdesk project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Besides the Django app it serves live comment streams at
+``/events/question/<id>/`` (server-sent events, see ``main/realtime.py``).
 
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
@@ -12,5 +14,19 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'helpdesk.settings')
+# settings.REALTIME_ENABLED: live comments sirf tab jab yahi app serve ho
+os.environ.setdefault('DJANGO_ASGI', 'true')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+from main import realtime  # noqa: E402  (Django setup ke baad)
+
+
+async def application(scope, receive, send):
+    # SSE stream Django middleware/view stack ke bahar: har idle client
+    # sirf ek coroutine + queue hai
+    if scope["type"] == "http" and scope["method"] == "GET":
+        match = realtime.EVENTS_PATH.match(scope["path"])
+        if match:
+            return await realtime.question_stream(scope, receive, send, int(match.group(1)))
+    return await django_application(scope, receive, send)
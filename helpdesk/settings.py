@@ -50,8 +50,10 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'main.middleware.ProfilingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'main.middleware.BulkheadMiddleware',
 ]
 
 ROOT_URLCONF = 'helpdesk.urls'
@@ -67,6 +69,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'main.context_processors.unread_notifications',
             ],
         },
     },
@@ -101,6 +104,26 @@ DATABASES = {
 
 
 
+# Cache (shared store for throttling etc.)
+# REDIS_URL set ho to Redis; warna database cache table (migration 0014
+# `createcachetable` chalata hai). Dono sab workers me shared hain, LocMem
+# per-process hota aur har worker apne alag counters rakhta.
+if os.getenv("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.getenv("REDIS_URL"),
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache",
+        }
+    }
+
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',},
@@ -130,8 +153,92 @@ MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 DEBUG = True
 
 
-# whitenoise storage
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# whitenoise storage: fingerprinted names + gzip/brotli (Brotli package ho to)
+# (STATICFILES_STORAGE Django 5.1 me hat gaya, ab STORAGES use hota hai)
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
+
+# Background jobs (main/utils/jobs.py): in-process thread pool
+BACKGROUND_JOBS_WORKERS = int(os.getenv("BACKGROUND_JOBS_WORKERS", "2"))
+BACKGROUND_JOBS_SYNC = os.getenv("BACKGROUND_JOBS_SYNC", "false").lower() == "true"
+
+
+# Live comments (main/realtime.py): LocalBackend ek process tak; WSGI + ASGI
+# alag processes me hon to RedisBackend (REDIS_URL) chahiye
+PUBSUB_BACKEND = os.getenv("PUBSUB_BACKEND", "main.utils.pubsub.LocalBackend")
+PUBSUB_REDIS_URL = os.getenv("REDIS_URL")
+REALTIME_HEARTBEAT = 25
+# SSE script sirf tab jab ASGI app serve ho raha (WSGI pe /events/ 404 deta).
+# helpdesk/asgi.py import hote hi DJANGO_ASGI set karta hai, to ye asal
+# served app se tay hota hai, GUNICORN_ASGI se nahi. Alag ASGI process
+# (Redis pub/sub) ho to WSGI side pe REALTIME_ENABLED=true khud set karo.
+REALTIME_ENABLED = os.getenv("REALTIME_ENABLED", os.getenv("DJANGO_ASGI", "false")).lower() == "true"
+
+
+# Notifications (main/notifications.py): comment bursts itni der buffer hote hain
+NOTIFICATION_FLUSH_DELAY = 2.0
+
+
+# Admin changelists: itne se bade tables pe planner estimate (Postgres)
+ADMIN_ESTIMATED_COUNT_THRESHOLD = 10000
+
+
+# Archival: itne din inactive threads archive tables me (manage.py archive_threads)
+ARCHIVE_INACTIVE_DAYS = int(os.getenv("ARCHIVE_INACTIVE_DAYS", "365"))
+
+
+# Hot questions ranking (main/hot.py); `manage.py refresh_hot_questions` cron se chalao
+HOT_QUESTIONS = {
+    "HALF_LIFE_HOURS": 24,
+    "WINDOW_DAYS": 14,
+    "VIEW_FLUSH_INTERVAL": 30.0,
+    "HOME_SIZE": 6,
+}
+
+
+# Bulkheads (main/middleware.py): URL name -> per-worker concurrency cap.
+# Yahan jo nahi hai wo unlimited; shed counts /metrics/ pe
+BULKHEADS = {
+    "ai_suggest": {"MAX_CONCURRENT": 2, "QUEUE_TIMEOUT": 0.5, "RETRY_AFTER": 10, "JSON": True},
+    # SMTP
+    "signup": {"MAX_CONCURRENT": 2, "QUEUE_TIMEOUT": 2.0, "RETRY_AFTER": 5, "METHODS": ["POST"]},
+    "resend_otp": {"MAX_CONCURRENT": 1, "QUEUE_TIMEOUT": 1.0, "RETRY_AFTER": 5},
+    # Password hashing / uploads
+    "login": {"MAX_CONCURRENT": 3, "QUEUE_TIMEOUT": 2.0, "RETRY_AFTER": 2, "METHODS": ["POST"]},
+    "ask_question": {"MAX_CONCURRENT": 3, "QUEUE_TIMEOUT": 2.0, "RETRY_AFTER": 5, "METHODS": ["POST"]},
+}
+
+
+# Request profiling (main/middleware.py): staff `X-Profile: 1` header ya sampled
+# requests; profiles admin me (Request profiles), flame graph export ke saath
+PROFILING = {
+    "SAMPLE_RATE": float(os.getenv("PROFILING_SAMPLE_RATE", "0")),
+    "MAX_PROFILES": 500,
+    "RETENTION_DAYS": 7,
+}
+
+
+# Moderation (main/moderation.py): blocklist admin me (Blocked patterns);
+# per-user posting limits = (posts, window seconds), staff exempt
+MODERATION = {
+    "RELOAD_INTERVAL": 5,
+    "RATE_LIMITS": {
+        "question": (5, 600),
+        "comment": (30, 600),
+        "edit": (20, 600),
+    },
+}
+
+
+# Worker warm-up (gunicorn.conf.py DJANGO_WARMUP set karta hai, see main/warmup.py)
+WARMUP_ON_READY = os.getenv("DJANGO_WARMUP", "false").lower() == "true"
 
 
 # Default primary key field type
@@ -153,6 +260,20 @@ LOGIN_REDIRECT_URL = '/profile/'
 LOGOUT_REDIRECT_URL = '/'
 
 
+# Login throttling (per-username + per-IP sliding window, see main/utils/login_throttle.py)
+LOGIN_THROTTLE = {
+    "WINDOW": int(os.getenv("LOGIN_THROTTLE_WINDOW", "300")),
+    "USERNAME_LIMIT": int(os.getenv("LOGIN_THROTTLE_USERNAME_LIMIT", "5")),
+    "IP_LIMIT": int(os.getenv("LOGIN_THROTTLE_IP_LIMIT", "20")),
+    "BASE_DELAY": 2,
+    "MAX_DELAY": 900,
+}
+# Render ke proxy ke peeche client IP X-Forwarded-For se aata hai (Render
+# RENDER env set karta hai); 0 hota to sab requests ka IP proxy ka hota aur
+# IP lockout poori site ko lock kar deta
+NUM_PROXIES = int(os.getenv("NUM_PROXIES", "1" if os.getenv("RENDER") else "0"))
+
+
 # Email Settings (keep fixed, not in env)
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = 'smtp.gmail.com'
@@ -1,5 +1,206 @@
-from django.contrib import admin
-from .models import CustomUser, OTP
+import json
 
-admin.site.register(CustomUser)
-admin.site.register(OTP)
+from django.conf import settings
+from django.contrib import admin, messages
+from django.contrib.auth.admin import UserAdmin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import path, reverse
+from django.utils.functional import cached_property
+from django.utils.html import format_html, format_html_join
+from django.utils.text import Truncator
+
+from .models import BlockedPattern, CustomUser, OTP, Question, Comment, Profile, RequestProfile
+from .utils import bulk
+
+
+# Bade tables pe changelist ka exact COUNT(*) hi sabse mehnga hai.
+# Postgres pe planner ka estimate lo (pg_class.reltuples / EXPLAIN);
+# chhote result ya doosre DB pe exact count hi chalega.
+def estimated_count(queryset):
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    if not queryset.query.where:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        return row[0] if row and row[0] >= 0 else None
+    plan = json.loads(queryset.order_by().explain(format="json"))
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self):
+        threshold = getattr(settings, "ADMIN_ESTIMATED_COUNT_THRESHOLD", 10000)
+        estimate = estimated_count(self.object_list)
+        if estimate is not None and estimate > threshold:
+            return estimate
+        return super().count
+
+
+class ScalableAdminMixin:
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False  # doosra COUNT(*) mat chalao
+    list_per_page = 50
+
+    def get_search_results(self, request, queryset, search_term):
+        # Number diya to primary key bhi match karo, normal search ke saath
+        # (^phone jaise numeric search fields bhi chalte rahein)
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        term = search_term.strip()
+        if term.isdigit():
+            results |= queryset.filter(pk=int(term))
+        return results, may_have_duplicates
+
+    def get_actions(self, request):
+        # delete_selected sab objects memory me laake ek transaction me delete karta hai
+        actions = super().get_actions(request)
+        actions.pop("delete_selected", None)
+        return actions
+
+
+# Search sirf prefix ("^") lookups: UPPER(col) LIKE 'X%' jo migration 0006 ke
+# pattern_ops indexes se serve hota hai, poora table scan nahi.
+
+@admin.register(CustomUser)
+class CustomUserAdmin(ScalableAdminMixin, UserAdmin):
+    list_display = ("username", "email", "phone", "is_active", "is_staff", "date_joined")
+    list_filter = ("is_active", "is_staff", "is_superuser")
+    search_fields = ("^username", "^email", "^phone")
+    fieldsets = UserAdmin.fieldsets + (("Contact", {"fields": ("phone", "deleted_at")}),)
+    readonly_fields = ("deleted_at",)
+    actions = ["deactivate_users", "soft_delete_users"]
+
+    @admin.action(description="Deactivate selected users (background)")
+    def deactivate_users(self, request, queryset):
+        bulk.submit_update(queryset, {"is_active": False})
+        messages.info(request, "Deactivation started in the background.")
+
+    @admin.action(description="Delete selected users and their content (background)")
+    def soft_delete_users(self, request, queryset):
+        bulk.submit_soft_delete(queryset.exclude(pk=request.user.pk))
+        messages.info(request, "Deletion started in the background.")
+
+
+@admin.register(Question)
+class QuestionAdmin(ScalableAdminMixin, admin.ModelAdmin):
+    list_display = ("id", "title", "user", "file_kind", "created_at")
+    list_select_related = ("user",)
+    raw_id_fields = ("user",)
+    search_fields = ("^title", "^user__username")
+    date_hierarchy = "created_at"
+    actions = ["soft_delete_selected"]
+
+    @admin.action(description="Delete selected questions (background)")
+    def soft_delete_selected(self, request, queryset):
+        bulk.submit_soft_delete(queryset)
+        messages.info(request, "Deletion started in the background.")
+
+
+@admin.register(Comment)
+class CommentAdmin(ScalableAdminMixin, admin.ModelAdmin):
+    list_display = ("id", "short_content", "author", "question", "created_at")
+    list_select_related = ("author", "question")
+    raw_id_fields = ("question", "author")
+    search_fields = ("^author__username",)
+    date_hierarchy = "created_at"
+    actions = ["soft_delete_selected"]
+
+    @admin.display(description="Content")
+    def short_content(self, obj):
+        return Truncator(obj.content).chars(60)
+
+    @admin.action(description="Delete selected comments (background)")
+    def soft_delete_selected(self, request, queryset):
+        bulk.submit_soft_delete(queryset)
+        messages.info(request, "Deletion started in the background.")
+
+
+@admin.register(OTP)
+class OTPAdmin(ScalableAdminMixin, admin.ModelAdmin):
+    list_display = ("id", "user", "code", "created_at")
+    list_select_related = ("user",)
+    raw_id_fields = ("user",)
+    search_fields = ("^user__username",)
+    actions = ["delete_in_background"]
+
+    @admin.action(description="Delete selected OTPs (background)")
+    def delete_in_background(self, request, queryset):
+        bulk.submit_delete(queryset)
+        messages.info(request, "Deletion started in the background.")
+
+
+@admin.register(Profile)
+class ProfileAdmin(ScalableAdminMixin, admin.ModelAdmin):
+    list_display = ("id", "user")
+    list_select_related = ("user",)
+    raw_id_fields = ("user",)
+    search_fields = ("^user__username",)
+
+
+@admin.register(RequestProfile)
+class RequestProfileAdmin(ScalableAdminMixin, admin.ModelAdmin):
+    list_display = ("id", "created_at", "method", "path", "status_code", "duration_ms", "sql_count", "sql_ms",
+                    "trigger", "flame_graph_link")
+    list_filter = ("trigger", "method", "url_name")
+    search_fields = ("^path", "^url_name")
+    date_hierarchy = "created_at"
+    exclude = ("collapsed_stacks", "slow_queries", "top_functions")
+    readonly_fields = ("created_at", "user", "method", "path", "url_name", "trigger", "status_code", "duration_ms",
+                       "sql_count", "sql_ms", "samples", "flame_graph_link", "slow_query_table", "hot_functions")
+    actions = ["delete_in_background"]
+
+    def has_add_permission(self, request):
+        return False
+
+    def get_urls(self):
+        return [
+            path("<int:pk>/collapsed/", self.admin_site.admin_view(self.collapsed_view), name="main_requestprofile_collapsed"),
+        ] + super().get_urls()
+
+    def collapsed_view(self, request, pk):
+        if not self.has_view_permission(request):
+            return HttpResponse(status=403)
+        profile = get_object_or_404(RequestProfile, pk=pk)
+        response = HttpResponse(profile.collapsed_stacks, content_type="text/plain; charset=utf-8")
+        response["Content-Disposition"] = f'attachment; filename="profile-{pk}.folded"'
+        return response
+
+    @admin.display(description="Flame graph")
+    def flame_graph_link(self, obj):
+        # .folded file flamegraph.pl ya speedscope.app me kholo
+        url = reverse("admin:main_requestprofile_collapsed", args=[obj.pk])
+        return format_html('<a href="{}">{} samples (.folded)</a>', url, obj.samples)
+
+    @admin.display(description="Slowest queries")
+    def slow_query_table(self, obj):
+        return format_html(
+            "<table>{}</table>",
+            format_html_join("", "<tr><td>{}&nbsp;ms</td><td><code>{}</code></td></tr>",
+                             ((q["ms"], q["sql"]) for q in obj.slow_queries)),
+        )
+
+    @admin.display(description="Top functions (self samples)")
+    def hot_functions(self, obj):
+        return format_html("<pre>{}</pre>", obj.top_functions)
+
+    @admin.action(description="Delete selected profiles (background)")
+    def delete_in_background(self, request, queryset):
+        bulk.submit_delete(queryset)
+        messages.info(request, "Deletion started in the background.")
+
+
+@admin.register(BlockedPattern)
+class BlockedPatternAdmin(admin.ModelAdmin):
+    # Save/delete pe workers matcher khud reload karte hain (main/moderation.py)
+    list_display = ("pattern", "whole_word", "is_active", "note", "created_at")
+    list_editable = ("whole_word", "is_active")
+    list_filter = ("is_active", "whole_word")
+    search_fields = ("^pattern",)
@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class MainConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'main'
+
+    def ready(self):
+        from . import hot, moderation, notifications, realtime, tags  # noqa: F401  (signal receivers)
+
+        # Sirf server process me warm-up (manage.py migrate/collectstatic me nahi)
+        if getattr(settings, "WARMUP_ON_READY", False):
+            from . import warmup
+            warmup.warm_up_shared()
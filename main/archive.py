@@ -0,0 +1,112 @@
+import logging
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Max
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from . import tags
+from .models import ArchivedComment, ArchivedQuestion, Comment, Question
+from .utils.attachments import META_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Hot/cold archival: jis thread pe ARCHIVE_INACTIVE_DAYS se koi activity nahi,
+# uska question + comments archive tables me move (same ids). Restore ulta
+# kaam karta hai, jab koi archived thread pe comment kare.
+
+QUESTION_FIELDS = ["id", "user_id", "title", "body", "description", "file", "created_at", *META_FIELDS]
+COMMENT_FIELDS = ["id", "author_id", "content", "file", "created_at", *META_FIELDS]
+
+
+def _copy(obj, fields):
+    return {f: getattr(obj, f) for f in fields}
+
+
+def inactive_question_ids(cutoff, batch_size, after_id=0):
+    # created_at < cutoff pehle filter (sasta), phir latest comment check
+    return list(
+        Question.objects.filter(id__gt=after_id, created_at__lt=cutoff)
+        .annotate(last_activity=Coalesce(Max("comments__created_at"), "created_at"))
+        .filter(last_activity__lt=cutoff)
+        .order_by("id")
+        .values_list("id", flat=True)[:batch_size]
+    )
+
+
+@transaction.atomic
+def archive_threads(question_ids, cutoff=None):
+    questions = list(Question.objects.filter(id__in=question_ids).select_for_update().prefetch_related("tags"))
+    comments = list(Comment.all_objects.filter(question_id__in=question_ids, deleted_at__isnull=True))
+
+    last_activity = {q.id: q.created_at for q in questions}
+    for c in comments:
+        last_activity[c.question_id] = max(last_activity[c.question_id], c.created_at)
+
+    if cutoff is not None:
+        # inactive_question_ids lock ke bahar chala tha: beech me comment aaya
+        # ho to ab (locked rows pe) dobara check karke wo thread chhod do
+        questions = [q for q in questions if last_activity[q.id] < cutoff]
+        kept = {q.id for q in questions}
+        comments = [c for c in comments if c.question_id in kept]
+
+    ArchivedQuestion.objects.bulk_create([
+        ArchivedQuestion(**_copy(q, QUESTION_FIELDS), tag_names=tags.tag_text(q), last_activity_at=last_activity[q.id])
+        for q in questions
+    ])
+    ArchivedComment.objects.bulk_create([
+        ArchivedComment(**_copy(c, COMMENT_FIELDS), question_id=c.question_id) for c in comments
+    ])
+
+    archived_ids = [q.id for q in questions]
+    tags.release_questions(archived_ids)
+    # Files media/ me hi rehti hain, sirf rows move hoti hain. Sirf copy kiye
+    # comments (+ soft-deleted, jo archive nahi hote) delete, baaki kuch nahi
+    Comment.all_objects.filter(id__in=[c.id for c in comments]).delete()
+    Comment.all_objects.filter(question_id__in=archived_ids, deleted_at__isnull=False).delete()
+    Question.all_objects.filter(id__in=archived_ids).delete()
+    return len(questions), len(comments)
+
+
+def archive_inactive(days, batch_size=100, dry_run=False):
+    cutoff = timezone.now() - timedelta(days=days)
+    threads = comments = 0
+    last_id = 0
+    while True:
+        ids = inactive_question_ids(cutoff, batch_size, after_id=last_id)
+        if not ids:
+            break
+        last_id = ids[-1]
+        if dry_run:
+            threads += len(ids)
+            continue
+        q_count, c_count = archive_threads(ids, cutoff=cutoff)
+        threads += q_count
+        comments += c_count
+    if threads and not dry_run:
+        logger.info("archive: %s threads, %s comments moved to cold storage", threads, comments)
+    return threads, comments
+
+
+@transaction.atomic
+def restore_thread(archived):
+    """Move an archived thread back into the hot tables; returns the Question."""
+    question = Question(**_copy(archived, QUESTION_FIELDS))
+    question.save(force_insert=True)
+    # auto_now_add ne created_at overwrite kiya, original wapas rakho
+    question.created_at = archived.created_at
+    Question.objects.filter(pk=question.pk).update(created_at=question.created_at)
+
+    rows = list(archived.comments.all())
+    comments = Comment.objects.bulk_create([
+        Comment(**_copy(c, COMMENT_FIELDS), question_id=question.pk) for c in rows
+    ])
+    # bulk_create bhi auto_now_add lagata hai; bulk_update pre_save nahi chalata
+    for comment, row in zip(comments, rows):
+        comment.created_at = row.created_at
+    Comment.objects.bulk_update(comments, ["created_at"], batch_size=500)
+    tags.set_question_tags(question, archived.tag_names)
+
+    archived.delete()
+    return question
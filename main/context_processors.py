@@ -0,0 +1,11 @@
+from django.utils.functional import SimpleLazyObject
+
+from . import notifications
+
+
+def unread_notifications(request):
+    # Cached count; template me use na ho to cache bhi nahi chhua jaata
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return {}
+    return {"unread_notifications": SimpleLazyObject(lambda: notifications.unread_count(user.pk))}
@@ -1,6 +1,9 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm
 from .models import CustomUser, Question, Comment
+from . import moderation
+
+SPAM_MESSAGE = "Your post was blocked by the spam filter. Please rephrase and try again."
 
 #  Signup Form
 class SignupForm(UserCreationForm):
@@ -14,6 +17,15 @@ class OTPForm(forms.Form):
 
 # ❓ Ask a Question Form
 class QuestionForm(forms.ModelForm):
+    tags = forms.CharField(
+        required=False,
+        max_length=255,
+        help_text="Up to 5 tags, comma separated (e.g. django, login).",
+        widget=forms.TextInput(attrs={
+            'class': 'form-control',
+            'placeholder': 'django, python, deployment'
+        })
+    )
     file = forms.FileField(
         required=False,   # file optional kar diya
         widget=forms.ClearableFileInput(attrs={
@@ -35,6 +47,12 @@ class QuestionForm(forms.ModelForm):
             }),
         }
 
+    def clean(self):
+        cleaned = super().clean()
+        if moderation.find_blocked(cleaned.get('title'), cleaned.get('description'), cleaned.get('tags')):
+            raise forms.ValidationError(SPAM_MESSAGE, code='spam')
+        return cleaned
+
 
 #  Comment Form
 class CommentForm(forms.ModelForm):
@@ -45,6 +63,12 @@ class CommentForm(forms.ModelForm):
             'content': forms.Textarea(attrs={'class': 'form-control', 'placeholder': 'Write your comment...'}),
         }
 
+    def clean(self):
+        cleaned = super().clean()
+        if moderation.find_blocked(cleaned.get('content')):
+            raise forms.ValidationError(SPAM_MESSAGE, code='spam')
+        return cleaned
+
 #  Search Form
 class SearchForm(forms.Form):
     query = forms.CharField(
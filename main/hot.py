@@ -0,0 +1,190 @@
+import atexit
+import logging
+import math
+import threading
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Comment, HotQuestion, Question, soft_deleted
+from .utils import jobs
+
+logger = logging.getLogger(__name__)
+
+# Hot questions ranking. Har event (question post, comment, views) ka weight
+# time ke saath half-life se decay hota hai. Decay sab rows pe same factor hai,
+# isliye score ko log2(sum(w * 2^(t/half_life))) store karte hain: naya event
+# sirf apni row badhata hai, purani rows apne aap neeche khisakti hain aur
+# home seedha `ORDER BY score DESC` index padhta hai. Views memory me count
+# hote hain aur VIEW_FLUSH_INTERVAL pe ek batch me likhe jaate hain.
+
+DEFAULTS = {
+    "HALF_LIFE_HOURS": 24,
+    "QUESTION_WEIGHT": 5.0,
+    "COMMENT_WEIGHT": 3.0,
+    "VIEW_WEIGHT": 0.1,
+    "WINDOW_DAYS": 14,  # isse purani activity wali rows refresh me hat jaati hain
+    "VIEW_FLUSH_INTERVAL": 30.0,
+    "HOME_SIZE": 6,
+}
+
+_views = Counter()
+_views_lock = threading.Lock()
+_flush_timer = None
+
+
+def conf(name):
+    return getattr(settings, "HOT_QUESTIONS", {}).get(name, DEFAULTS[name])
+
+
+def event_score(weight, when):
+    return when.timestamp() / (conf("HALF_LIFE_HOURS") * 3600) + math.log2(weight)
+
+
+def add_score(score, weight, when):
+    """log2(2^score + weight * 2^(t/half_life)) without overflow."""
+    new = event_score(weight, when)
+    if score is None:
+        return new
+    high = max(score, new)
+    return high + math.log2(2 ** (score - high) + 2 ** (new - high))
+
+
+def apply(events, when=None):
+    """events: {question_id: (views, comments)}; weights config se."""
+    when = when or timezone.now()
+    view_weight, comment_weight = conf("VIEW_WEIGHT"), conf("COMMENT_WEIGHT")
+    with transaction.atomic():
+        rows = HotQuestion.objects.select_for_update().in_bulk(list(events))
+        # Row nahi hai (window se bahar gir gayi thi) to live question ke liye nayi
+        missing = set(events) - set(rows)
+        if missing:
+            for qid in Question.objects.filter(id__in=missing).values_list("id", flat=True):
+                rows[qid] = HotQuestion(question_id=qid, score=None, last_activity_at=when)
+        for qid, row in rows.items():
+            views, comments = events[qid]
+            weight = views * view_weight + comments * comment_weight
+            row.score = add_score(row.score, weight, when)
+            row.view_count += views
+            row.comment_count += comments
+            row.last_activity_at = when
+        new = [row for row in rows.values() if row._state.adding]
+        HotQuestion.objects.bulk_create(new, ignore_conflicts=True)
+        HotQuestion.objects.bulk_update(
+            [row for row in rows.values() if not row._state.adding],
+            ["score", "view_count", "comment_count", "last_activity_at"],
+            batch_size=500,
+        )
+
+
+def flush_views():
+    global _flush_timer
+    with _views_lock:
+        batch = dict(_views)
+        _views.clear()
+        _flush_timer = None
+    if batch:
+        apply({qid: (n, 0) for qid, n in batch.items()})
+    return len(batch)
+
+
+def record_view(question_id):
+    global _flush_timer
+    if getattr(settings, "BACKGROUND_JOBS_SYNC", False):
+        apply({question_id: (1, 0)})
+        return
+    with _views_lock:
+        _views[question_id] += 1
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(conf("VIEW_FLUSH_INTERVAL"), jobs.submit, [flush_views])
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def _flush_at_exit():
+    # Worker band hote waqt pending views drop na hon
+    try:
+        flush_views()
+    except Exception as e:
+        logger.warning("hot: pending views lost at exit: %s", e)
+
+
+atexit.register(_flush_at_exit)
+
+
+def top(limit=None):
+    return (
+        HotQuestion.objects.filter(question__deleted_at__isnull=True)
+        .select_related("question__user")
+        .order_by("-score")[:limit or conf("HOME_SIZE")]
+    )
+
+
+def rebuild_score(question, comment_times):
+    score = add_score(None, conf("QUESTION_WEIGHT"), question.created_at)
+    for created_at in comment_times:
+        score = add_score(score, conf("COMMENT_WEIGHT"), created_at)
+    return score
+
+
+def refresh(batch_size=500):
+    """Periodic job: flush views, drop stale rows, seed rows the signals missed."""
+    flushed = flush_views()
+    cutoff = timezone.now() - timedelta(days=conf("WINDOW_DAYS"))
+
+    stale, _ = HotQuestion.objects.filter(last_activity_at__lt=cutoff).delete()
+    dead, _ = HotQuestion.objects.filter(question__deleted_at__isnull=False).delete()
+
+    # Window me active questions jinki row nahi (backfill, restore, signal miss)
+    active = Question.objects.filter(hot__isnull=True).filter(
+        Q(created_at__gte=cutoff) | Q(comments__created_at__gte=cutoff)
+    )
+    seeded = 0
+    ids = list(active.values_list("id", flat=True).distinct().order_by("id"))
+    for start in range(0, len(ids), batch_size):
+        questions = Question.objects.filter(id__in=ids[start:start + batch_size])
+        comment_times = {}
+        for qid, created_at in Comment.objects.filter(question__in=questions).values_list("question_id", "created_at"):
+            comment_times.setdefault(qid, []).append(created_at)
+        rows = []
+        for q in questions:
+            times = comment_times.get(q.id, [])
+            rows.append(HotQuestion(
+                question=q,
+                score=rebuild_score(q, times),
+                comment_count=len(times),
+                last_activity_at=max([q.created_at, *times]),
+            ))
+        HotQuestion.objects.bulk_create(rows, ignore_conflicts=True)
+        seeded += len(rows)
+
+    logger.info("hot: views flushed for %s questions, %s stale + %s deleted rows dropped, %s seeded",
+                flushed, stale, dead, seeded)
+    return {"flushed": flushed, "dropped": stale + dead, "seeded": seeded}
+
+
+@receiver(post_save, sender=Question)
+def rank_new_question(sender, instance, created, **kwargs):
+    if created:
+        now = timezone.now()
+        transaction.on_commit(lambda: HotQuestion.objects.get_or_create(
+            question_id=instance.pk,
+            defaults={"score": event_score(conf("QUESTION_WEIGHT"), now), "last_activity_at": now},
+        ))
+
+
+@receiver(post_save, sender=Comment)
+def rank_new_comment(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: apply({instance.question_id: (0, 1)}))
+
+
+@receiver(soft_deleted, sender=Question)
+def unrank_deleted_questions(sender, pks, **kwargs):
+    HotQuestion.objects.filter(question_id__in=pks).delete()
@@ -0,0 +1,22 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from main import archive
+
+
+class Command(BaseCommand):
+    help = "Move threads with no activity for N days into the archive tables."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--inactive-days", type=int, default=getattr(settings, "ARCHIVE_INACTIVE_DAYS", 365))
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--dry-run", action="store_true", help="Only count threads that would move.")
+
+    def handle(self, *args, **options):
+        threads, comments = archive.archive_inactive(
+            options["inactive_days"], batch_size=options["batch_size"], dry_run=options["dry_run"]
+        )
+        if options["dry_run"]:
+            self.stdout.write(f"{threads} threads would be archived")
+        else:
+            self.stdout.write(f"{threads} threads ({comments} comments) archived")
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from main.models import Comment, Question
+from main.utils import attachments
+
+
+class Command(BaseCommand):
+    help = "Detect kind/MIME/size/dimensions for attachments uploaded before metadata was stored."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="Re-inspect rows that already have metadata.")
+
+    def handle(self, *args, **options):
+        for model in (Question, Comment):
+            rows = model.objects.exclude(file="").exclude(file__isnull=True)
+            if not options["all"]:
+                rows = rows.filter(file_kind="")
+
+            done = missing = 0
+            for obj in rows.only("id", "file", *attachments.META_FIELDS).iterator(chunk_size=200):
+                try:
+                    attachments.refresh_meta(obj, force=True)
+                except (FileNotFoundError, OSError):
+                    missing += 1
+                    continue
+                obj.save(update_fields=attachments.META_FIELDS)
+                done += 1
+
+            self.stdout.write(f"{model.__name__}: {done} updated, {missing} missing files")
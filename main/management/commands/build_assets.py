@@ -0,0 +1,88 @@
+import posixpath
+import re
+import urllib.request
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from main.utils.assets import BUNDLES, VENDOR, bundle_path
+
+# Static asset pipeline (build.sh me collectstatic se pehle chalta hai):
+#   1. vendor CSS/fonts pinned CDN URLs se main/static/vendor/ me download
+#   2. vendor + templates se nikaali CSS ko minify karke bundles/*.min.css
+#      (bundles ki list main/utils/assets.py me)
+# Fingerprinting aur gzip/brotli collectstatic (WhiteNoise storage) karta hai.
+
+STATIC_SRC = Path(settings.BASE_DIR) / "main" / "static"
+
+URL_RE = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+
+
+def rebase_urls(css, src, dest):
+    # Bundle doosri directory me likha jaata hai, relative url() theek karo
+    src_dir, dest_dir = posixpath.dirname(src), posixpath.dirname(dest)
+
+    def fix(match):
+        quote, url = match.groups()
+        if url.startswith(("data:", "http:", "https:", "//", "/", "#")):
+            return match.group(0)
+        path, sep, query = url.partition("?")
+        target = posixpath.normpath(posixpath.join(src_dir, path))
+        return f'url("{posixpath.relpath(target, dest_dir)}{sep}{query}")'
+
+    return URL_RE.sub(fix, css)
+
+
+def minify_css(css):
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    # ":" ke pehle ka space selector me matter karta hai (a :hover), sirf baad ka hatao
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+class Command(BaseCommand):
+    help = "Vendor third-party CSS/fonts and build minified CSS bundles into main/static/bundles/."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--refresh", action="store_true", help="Re-download vendor files even if present.")
+        parser.add_argument("--strict", action="store_true", help="Fail if a vendor file cannot be fetched.")
+
+    def handle(self, *args, **options):
+        missing = self.fetch_vendor(options["refresh"])
+        if missing and options["strict"]:
+            raise CommandError(f"Could not vendor: {', '.join(missing)}")
+
+        out_dir = STATIC_SRC / "bundles"
+        out_dir.mkdir(parents=True, exist_ok=True)
+        for name, sources in BUNDLES.items():
+            dest = bundle_path(name)
+            parts = []
+            for src in sources:
+                if src in missing:
+                    continue
+                css = (STATIC_SRC / src).read_text(encoding="utf-8")
+                parts.append(minify_css(rebase_urls(css, src, dest)))
+            output = "\n".join(parts) + "\n"
+            (STATIC_SRC / dest).write_text(output, encoding="utf-8")
+            self.stdout.write(f"{dest}: {len(output) / 1024:.1f} KB")
+
+    def fetch_vendor(self, refresh):
+        missing = []
+        for rel, url in VENDOR.items():
+            path = STATIC_SRC / rel
+            if path.exists() and not refresh:
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                with urllib.request.urlopen(url, timeout=30) as resp:
+                    path.write_bytes(resp.read())
+                self.stdout.write(f"vendored {rel}")
+            except OSError as e:
+                self.stderr.write(f"could not fetch {url}: {e}")
+                if not path.exists():
+                    missing.append(rel)
+        return missing
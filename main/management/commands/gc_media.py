@@ -0,0 +1,92 @@
+import os
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from main.models import ArchivedComment, ArchivedQuestion, Comment, Profile, Question
+
+# media/ tree ko stream karke wo files hatao jinhe koi row refer nahi karti
+# (purane hard deletes / cascade se bachi hui files). Lookups batch me hote
+# hain, poora reference set memory me nahi banta.
+
+# (model manager, file field) jo media/ ko refer karte hain
+REFERENCES = [
+    (Question.all_objects, "file"),
+    (Comment.all_objects, "file"),
+    (Profile.objects, "profile_picture"),
+    (ArchivedQuestion.objects, "file"),
+    (ArchivedComment.objects, "file"),
+]
+KEEP = {"profile_pics/default.png"}
+
+
+def iter_media_files(root):
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.name.startswith("."):  # .DS_Store, .gitkeep
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def referenced(names):
+    found = set()
+    for manager, field in REFERENCES:
+        found.update(manager.filter(**{f"{field}__in": names}).values_list(field, flat=True))
+    return found
+
+
+class Command(BaseCommand):
+    help = "Delete files under MEDIA_ROOT that no (archived) Question, Comment or Profile row references."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Only list orphaned files.")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--min-age", type=int, default=3600,
+            help="Skip files modified in the last N seconds (upload may not be committed yet).",
+        )
+
+    def handle(self, *args, **options):
+        root = str(settings.MEDIA_ROOT)
+        cutoff = time.time() - options["min_age"]
+        stats = {"scanned": 0, "orphaned": 0, "bytes": 0}
+
+        batch = []
+        for entry in iter_media_files(root):
+            stats["scanned"] += 1
+            name = os.path.relpath(entry.path, root).replace(os.sep, "/")
+            if name in KEEP or entry.stat().st_mtime > cutoff:
+                continue
+            batch.append((name, entry))
+            if len(batch) >= options["batch_size"]:
+                self.collect(batch, stats, options["dry_run"])
+                batch = []
+        if batch:
+            self.collect(batch, stats, options["dry_run"])
+
+        verb = "would free" if options["dry_run"] else "freed"
+        self.stdout.write(
+            f"{stats['scanned']} files scanned, {stats['orphaned']} orphaned, "
+            f"{verb} {stats['bytes'] / 1024 / 1024:.1f} MB"
+        )
+
+    def collect(self, batch, stats, dry_run):
+        keep = referenced([name for name, _ in batch])
+        for name, entry in batch:
+            if name in keep:
+                continue
+            stats["orphaned"] += 1
+            stats["bytes"] += entry.stat().st_size
+            if dry_run:
+                self.stdout.write(f"orphan: {name}")
+            else:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from main.utils import purge
+
+
+class Command(BaseCommand):
+    help = "Hard-delete soft-deleted users, questions and comments (and their media) in small batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=purge.DEFAULT_BATCH_SIZE)
+        parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches.")
+
+    def handle(self, *args, **options):
+        total = purge.purge_deleted(batch_size=options["batch_size"], max_batches=options["max_batches"])
+        self.stdout.write(f"{total} rows deleted")
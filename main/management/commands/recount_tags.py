@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+from main.models import QuestionTag, Tag
+
+
+class Command(BaseCommand):
+    help = "Recompute Tag.question_count from the join table (repairs drift)."
+
+    def handle(self, *args, **options):
+        live = (
+            QuestionTag.objects.filter(tag=OuterRef("pk"), question__deleted_at__isnull=True)
+            .values("tag").annotate(n=Count("id")).values("n")
+        )
+        updated = Tag.objects.update(question_count=Coalesce(Subquery(live), Value(0)))
+        self.stdout.write(f"{updated} tags recounted")
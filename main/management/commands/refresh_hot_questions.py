@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from main import hot
+
+
+class Command(BaseCommand):
+    help = "Flush buffered views, drop stale hot-ranking rows and seed missing ones (run from cron)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        stats = hot.refresh(batch_size=options["batch_size"])
+        self.stdout.write("{flushed} questions' views flushed, {dropped} rows dropped, {seeded} seeded".format(**stats))
@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Cold process me `python -X importtime` chala ke dikhata hai ki
+# startup ka time kahan ja raha hai (imports + warm-up steps)
+
+PROBE = """
+import os, time
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "helpdesk.settings")
+started = time.perf_counter()
+from helpdesk.wsgi import application
+print("@@app %.6f" % (time.perf_counter() - started))
+from main import warmup
+for name, secs in {**warmup.warm_up_shared(), **warmup.warm_up_worker()}.items():
+    print("@@step %s %.6f" % (name, secs))
+"""
+
+
+class Command(BaseCommand):
+    help = "Show where worker startup time goes (imports and warm-up steps)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=25, help="How many imports to list.")
+
+    def handle(self, *args, **options):
+        env = dict(os.environ)
+        env.pop("DJANGO_WARMUP", None)  # warm-up steps alag se time karne hain
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", PROBE],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            self.stderr.write(proc.stderr[-2000:])
+            return
+
+        imports = []
+        for line in proc.stderr.splitlines():
+            # "import time:      self [us] |  cumulative | imported package"
+            if not line.startswith("import time:") or "[us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            imports.append((name.rstrip(), int(self_us), int(cumulative_us)))
+
+        # nested imports extra indent ke saath aate hain
+        top_level = [i for i in imports if not i[0].startswith("  ")]
+        total_us = sum(cum for _, _, cum in top_level)
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Imports (by cumulative time)"))
+        for name, self_us, cumulative_us in sorted(imports, key=lambda i: -i[2])[: options["top"]]:
+            self.stdout.write(f"  {cumulative_us / 1000:9.1f} ms  (self {self_us / 1000:7.1f} ms)  {name.strip()}")
+        self.stdout.write(f"  total top-level imports: {total_us / 1000:.1f} ms")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("Startup phases"))
+        for line in proc.stdout.splitlines():
+            if line.startswith("@@app"):
+                self.stdout.write(f"  {float(line.split()[1]) * 1000:9.1f} ms  load wsgi application")
+            elif line.startswith("@@step"):
+                _, name, secs = line.split()
+                self.stdout.write(f"  {float(secs) * 1000:9.1f} ms  warm-up: {name}")
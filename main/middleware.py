@@ -0,0 +1,73 @@
+import threading
+import time
+
+from django.db import connection
+from django.http import HttpResponse, JsonResponse
+
+from .utils import bulkhead, profiling
+
+
+class BulkheadMiddleware:
+    """Per-URL-name concurrency caps (settings.BULKHEADS), see main/utils/bulkhead.py."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        try:
+            return self.get_response(request)
+        finally:
+            # process_view ne slot liya tha to view (aur baaki middleware) ke baad chhodo
+            held = getattr(request, "_bulkhead", None)
+            if held is not None:
+                held.release()
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        # URL resolve ho chuka hai, dobara resolve() nahi karna padta
+        match = request.resolver_match
+        b = bulkhead.for_request(request, match.url_name if match else None)
+        if b is None:
+            return None
+        if not b.acquire():
+            bulkhead.record_shed(b.name)
+            return self.busy(b)
+        request._bulkhead = b
+        return None
+
+    def busy(self, b):
+        message = "Server is busy, please retry shortly."
+        if b.json:
+            response = JsonResponse({"ok": False, "error": message}, status=503)
+        else:
+            response = HttpResponse(message, status=503, content_type="text/plain")
+        response["Retry-After"] = str(b.retry_after)
+        return response
+
+
+class ProfilingMiddleware:
+    """Opt-in request profiler (settings.PROFILING), see main/utils/profiling.py."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.conf = profiling._config()
+
+    def __call__(self, request):
+        trigger = profiling.trigger_for(request, self.conf)
+        if trigger is None:
+            return self.get_response(request)
+
+        sampler = profiling.StackSampler(threading.get_ident(), self.conf["INTERVAL"], self.conf["MAX_DEPTH"])
+        sql = profiling.SQLRecorder()
+        start = time.perf_counter()
+        sampler.start()
+        try:
+            with connection.execute_wrapper(sql):
+                response = self.get_response(request)
+        finally:
+            sampler.stop()
+        duration = time.perf_counter() - start
+
+        profiling.store(request, response, trigger, duration, sampler, sql, self.conf)
+        if trigger == "header":
+            response["X-Profile-Duration-Ms"] = f"{duration * 1000:.1f}"
+        return response
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+# Admin search "^field" lookups Postgres pe UPPER(col::text) LIKE UPPER('x%')
+# banate hain; text_pattern_ops expression index inhe index scan bana deta hai.
+# (SQLite pe ye indexes nahi bante, wahan tables chhote hain.)
+
+INDEXES = [
+    ("main_customuser", "username"),
+    ("main_customuser", "email"),
+    ("main_customuser", "phone"),
+    ("main_question", "title"),
+]
+
+
+def create_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column in INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{table}_{column}_upper_like" '
+            f'ON "{table}" (UPPER("{column}"::text) text_pattern_ops)'
+        )
+
+
+def drop_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, column in INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{table}_{column}_upper_like"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0005_notification'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_admin_search_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedQuestion',
+            fields=[
+                ('file_kind', models.CharField(blank=True, default='', max_length=10)),
+                ('file_mime', models.CharField(blank=True, default='', max_length=100)),
+                ('file_size', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('file_width', models.PositiveIntegerField(blank=True, null=True)),
+                ('file_height', models.PositiveIntegerField(blank=True, null=True)),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('body', models.TextField()),
+                ('description', models.TextField()),
+                ('file', models.FileField(blank=True, null=True, upload_to='uploads/')),
+                ('created_at', models.DateTimeField()),
+                ('last_activity_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedComment',
+            fields=[
+                ('file_kind', models.CharField(blank=True, default='', max_length=10)),
+                ('file_mime', models.CharField(blank=True, default='', max_length=100)),
+                ('file_size', models.PositiveBigIntegerField(blank=True, null=True)),
+                ('file_width', models.PositiveIntegerField(blank=True, null=True)),
+                ('file_height', models.PositiveIntegerField(blank=True, null=True)),
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('content', models.TextField()),
+                ('file', models.FileField(blank=True, null=True, upload_to='comment_files/')),
+                ('created_at', models.DateTimeField()),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='comments', to='main.archivedquestion')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0007_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50)),
+                ('slug', models.SlugField(unique=True)),
+                ('question_count', models.PositiveIntegerField(db_index=True, default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='archivedquestion',
+            name='tag_names',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.CreateModel(
+            name='QuestionTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tag_links', to='main.question')),
+                ('tag', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='question_links', to='main.tag')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='tags',
+            field=models.ManyToManyField(blank=True, related_name='questions', through='main.QuestionTag', to='main.tag'),
+        ),
+        migrations.AddConstraint(
+            model_name='questiontag',
+            constraint=models.UniqueConstraint(fields=('tag', 'question'), name='unique_question_tag'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0008_tags'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HotQuestion',
+            fields=[
+                ('question', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='hot', serialize=False, to='main.question')),
+                ('score', models.FloatField(db_index=True)),
+                ('view_count', models.PositiveIntegerField(default=0)),
+                ('comment_count', models.PositiveIntegerField(default=0)),
+                ('last_activity_at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
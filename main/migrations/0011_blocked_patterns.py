@@ -0,0 +1,24 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0010_request_profiles'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlockedPattern',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('pattern', models.CharField(max_length=100, unique=True)),
+                ('whole_word', models.BooleanField(default=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('note', models.CharField(blank=True, default='', max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0011_blocked_patterns'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='archivedquestion',
+            name='tag_names',
+            field=models.TextField(blank=True, default=''),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0012_archived_tag_names_text'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blockedpattern',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -18,6 +18,9 @@ class CustomUser(AbstractUser):
         blank=True     # admin form me optional rahega; superuser ke liye hum REQUIRED_FIELDS use karenge
     )
 
+    # Soft delete: row turant mark hoti hai, asli cascade background job karta hai
+    deleted_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
     # agar username hi login field hai, to phone ko REQUIRED_FIELDS me include karo
     REQUIRED_FIELDS = ["email", "phone"]  # createsuperuser ab phone puchhega
 
@@ -49,27 +52,119 @@ class OTP(models.Model):
 #         return self.title
 from django.db import models
 from django.conf import settings
-class Question(models.Model):
+from django.dispatch import Signal
+from .utils import attachments
+
+
+# Attachment metadata: upload ke time ek baar detect hota hai (magic bytes),
+# templates sirf ye fields padhte hain, file.url parse nahi karte
+class AttachmentMeta(models.Model):
+    file_kind = models.CharField(max_length=10, blank=True, default="")  # image / pdf / other
+    file_mime = models.CharField(max_length=100, blank=True, default="")
+    file_size = models.PositiveBigIntegerField(null=True, blank=True)
+    file_width = models.PositiveIntegerField(null=True, blank=True)
+    file_height = models.PositiveIntegerField(null=True, blank=True)
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        if attachments.refresh_meta(self) and kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = set(kwargs["update_fields"]) | set(attachments.META_FIELDS)
+        super().save(*args, **kwargs)
+
+    @property
+    def preview_kind(self):
+        # file_kind khali = backfill_attachment_meta abhi nahi chala
+        if self.file_kind or not self.file:
+            return self.file_kind
+        return attachments.kind_for_name(self.file.name)
+
+
+# Soft delete: default manager deleted rows chhupa deta hai,
+# purge job (main/utils/purge.py) all_objects se asli delete karta hai
+soft_deleted = Signal()  # sender=model, pks=[...]
+
+
+class LiveQuerySet(models.QuerySet):
+    def soft_delete(self):
+        pks = list(self.filter(deleted_at__isnull=True).values_list("pk", flat=True))
+        count = self.model.all_objects.filter(pk__in=pks).update(deleted_at=timezone.now())
+        soft_deleted.send(sender=self.model, pks=pks)
+        return count
+
+
+class LiveManager(models.Manager.from_queryset(LiveQuerySet)):
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
+class Question(AttachmentMeta):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     title = models.CharField(max_length=255)
     body = models.TextField()
     description = models.TextField()
     file = models.FileField(upload_to='uploads/', null=True, blank=True) 
     created_at = models.DateTimeField(auto_now_add=True)
+    deleted_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    tags = models.ManyToManyField("Tag", through="QuestionTag", related_name="questions", blank=True)
+
+    objects = LiveManager()
+    all_objects = LiveQuerySet.as_manager()
 
     def __str__(self):
         return self.title
 
 
+# Hot ranking: materialized per-question score (main/hot.py). score log2 space
+# me decayed sum hai, isliye naye events se purane rows ko rewrite nahi karna padta
+class HotQuestion(models.Model):
+    question = models.OneToOneField(Question, on_delete=models.CASCADE, primary_key=True, related_name="hot")
+    score = models.FloatField(db_index=True)
+    view_count = models.PositiveIntegerField(default=0)
+    comment_count = models.PositiveIntegerField(default=0)
+    last_activity_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.question_id}: {self.score:.3f}"
+
+
+# Tags: normalized model, question_count incrementally maintain hota hai
+# (main/tags.py), taaki tag cloud/listing ko COUNT na chalana pade
+class Tag(models.Model):
+    name = models.CharField(max_length=50)
+    slug = models.SlugField(max_length=50, unique=True)
+    question_count = models.PositiveIntegerField(default=0, db_index=True)
+
+    def __str__(self):
+        return self.name
+
+
+class QuestionTag(models.Model):
+    question = models.ForeignKey(Question, on_delete=models.CASCADE, related_name="tag_links")
+    # (tag, question) unique index hi /tag/<slug>/ keyset listing serve karta hai
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name="question_links", db_index=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["tag", "question"], name="unique_question_tag"),
+        ]
+
 
 
 
-class Comment(models.Model):
+
+class Comment(AttachmentMeta):
     question = models.ForeignKey(Question, on_delete=models.CASCADE, related_name='comments')
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     content = models.TextField()
     file = models.FileField(upload_to="comment_files/", null=True, blank=True)  # File upload for comments
     created_at = models.DateTimeField(auto_now_add=True)
+    deleted_at = models.DateTimeField(null=True, blank=True, db_index=True)
+
+    objects = LiveManager()
+    all_objects = LiveQuerySet.as_manager()
 
     def __str__(self):
         return f"{self.author.username} commented: {self.content}"
@@ -103,3 +198,97 @@ def create_or_update_user_profile(sender, instance, created, **kwargs):
     else:
         instance.profile.save()
 
+
+
+# Notification inbox: ek unread row per (user, thread); naye comments aate
+# rahein to count badhta hai (digest), nayi row nahi banti
+class Notification(models.Model):
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="notifications")
+    question = models.ForeignKey(Question, on_delete=models.CASCADE, related_name="+")
+    last_comment = models.ForeignKey(Comment, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    count = models.PositiveIntegerField(default=1)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(default=timezone.now)
+    read_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "read_at", "-updated_at"], name="notification_inbox_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "question"],
+                condition=models.Q(read_at__isnull=True),
+                name="unique_unread_notification_per_thread",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username}: {self.count} new on {self.question_id}"
+
+
+# Cold storage: inactive threads archive command (main/archive.py) se yahan
+# move hote hain, original ids ke saath, taaki hot tables chhote rahein.
+# view_question aur search inhe transparently padh lete hain.
+class ArchivedQuestion(AttachmentMeta):
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    title = models.CharField(max_length=255)
+    body = models.TextField()
+    description = models.TextField()
+    file = models.FileField(upload_to='uploads/', null=True, blank=True)
+    created_at = models.DateTimeField()
+    tag_names = models.TextField(blank=True, default="")  # 5 tags x 50 chars + separators
+    last_activity_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.title
+
+
+class ArchivedComment(AttachmentMeta):
+    id = models.BigIntegerField(primary_key=True)
+    question = models.ForeignKey(ArchivedQuestion, on_delete=models.CASCADE, related_name="comments")
+    author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="+")
+    content = models.TextField()
+    file = models.FileField(upload_to="comment_files/", null=True, blank=True)
+    created_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.author.username} commented: {self.content}"
+
+
+# Request profiles (main/utils/profiling.py): staff header ya sampling se
+# capture hote hain; retention limits ke baad purane khud hat jaate hain
+class RequestProfile(models.Model):
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    method = models.CharField(max_length=10)
+    path = models.CharField(max_length=255)
+    url_name = models.CharField(max_length=100, blank=True, default="")
+    trigger = models.CharField(max_length=10)  # header / sample
+    status_code = models.PositiveSmallIntegerField()
+    duration_ms = models.FloatField()
+    sql_count = models.PositiveIntegerField(default=0)
+    sql_ms = models.FloatField(default=0)
+    samples = models.PositiveIntegerField(default=0)
+    top_functions = models.TextField(blank=True, default="")
+    slow_queries = models.JSONField(default=list, blank=True)
+    collapsed_stacks = models.TextField(blank=True, default="")  # flamegraph.pl / speedscope format
+
+    def __str__(self):
+        return f"{self.method} {self.path} ({self.duration_ms:.0f} ms)"
+
+
+# Moderation blocklist (main/moderation.py): har worker (count, max
+# updated_at) RELOAD_INTERVAL pe check karke compiled matcher rebuild karta hai
+class BlockedPattern(models.Model):
+    pattern = models.CharField(max_length=100, unique=True)
+    whole_word = models.BooleanField(default=True)
+    is_active = models.BooleanField(default=True)
+    note = models.CharField(max_length=255, blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.pattern
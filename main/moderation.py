@@ -0,0 +1,171 @@
+import re
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import BlockedPattern
+
+# Spam filter, question/comment write path pe (DB write se pehle).
+# Poori blocklist ek hi compiled regex me: patterns ka trie banake usse
+# nested alternation banti hai, to regex engine (C me) har position pe bas
+# trie walk karta hai, pattern count se linear nahi. Har worker
+# RELOAD_INTERVAL me ek baar DB se (count, max updated_at) version padhta hai
+# aur badla ho to matcher rebuild karta hai; cache pe depend nahi, to har
+# process tak change pahunchta hai. Saath me per-user posting rate limits
+# (shared cache, settings.CACHES: Redis ya DB cache).
+
+DEFAULTS = {
+    "RELOAD_INTERVAL": 5,  # seconds
+    # kind -> (posts, window seconds)
+    "RATE_LIMITS": {
+        "question": (5, 600),
+        "comment": (30, 600),
+        "edit": (20, 600),
+    },
+}
+
+KEY_PREFIX = "moderation"
+STATS_BLOCKED = f"{KEY_PREFIX}:stats:blocked"
+STATS_RATE_LIMITED = f"{KEY_PREFIX}:stats:rate_limited"
+
+_matcher = None
+_matcher_version = None
+_checked_at = 0.0
+_matcher_lock = threading.Lock()
+
+
+def _config():
+    conf = dict(DEFAULTS)
+    conf.update(getattr(settings, "MODERATION", {}))
+    return conf
+
+
+def normalize(text):
+    return " ".join((text or "").casefold().split())
+
+
+def trie_regex(words):
+    """['cheap pills', 'cheap meds'] -> 'cheap\\ (?:meds|pills)'"""
+    trie = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = True
+
+    def build(node):
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        ends_here = "" in node
+        if len(branches) == 1 and not ends_here:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if ends_here else group
+
+    return build(trie)
+
+
+def compile_patterns(rows):
+    """rows: (pattern, whole_word) -> compiled regex, ya None agar list khali hai."""
+    words, substrings = set(), set()
+    for pattern, whole_word in rows:
+        pattern = normalize(pattern)
+        if pattern:
+            (words if whole_word else substrings).add(pattern)
+    parts = []
+    if words:
+        parts.append(r"(?<!\w)(?:" + trie_regex(words) + r")(?!\w)")
+    if substrings:
+        parts.append(trie_regex(substrings))
+    return re.compile("|".join(parts)) if parts else None
+
+
+def _current_version():
+    # Add/edit updated_at badhata hai, delete count ghatata hai
+    row = BlockedPattern.objects.aggregate(count=Count("id"), updated=Max("updated_at"))
+    return row["count"], row["updated"]
+
+
+def get_matcher():
+    global _matcher, _matcher_version, _checked_at
+    now = time.monotonic()
+    if _matcher_version is not None and now - _checked_at < _config()["RELOAD_INTERVAL"]:
+        return _matcher
+    with _matcher_lock:
+        version = _current_version()
+        if version != _matcher_version:
+            rows = BlockedPattern.objects.filter(is_active=True).values_list("pattern", "whole_word")
+            _matcher = compile_patterns(rows)
+            _matcher_version = version
+        _checked_at = now
+    return _matcher
+
+
+def find_blocked(*texts):
+    """First blocklisted pattern found in texts, else None."""
+    matcher = get_matcher()
+    if matcher is None:
+        return None
+    for text in texts:
+        match = matcher.search(normalize(text))
+        if match:
+            _incr(STATS_BLOCKED)
+            return match.group(0)
+    return None
+
+
+@receiver([post_save, post_delete], sender=BlockedPattern)
+def reload_patterns(sender, **kwargs):
+    # Is process me turant; baaki workers RELOAD_INTERVAL me DB version se
+    global _checked_at
+    _checked_at = float("-inf")
+
+
+def _incr(key, timeout=None):
+    cache.add(key, 0, timeout=timeout)
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=timeout)
+        return 1
+
+
+def _rate_key(kind, user_id, bucket):
+    return f"{KEY_PREFIX}:rate:{kind}:{user_id}:{bucket}"
+
+
+def rate_limited(user, kind):
+    """Seconds to wait before this user may post again, else 0. Staff exempt."""
+    if user.is_staff:
+        return 0
+    limit, window = _config()["RATE_LIMITS"][kind]
+    now = time.time()
+    bucket = int(now // window)
+    keys = [_rate_key(kind, user.pk, bucket), _rate_key(kind, user.pk, bucket - 1)]
+    counts = cache.get_many(keys)
+    # Sliding window: current bucket + previous ka bacha hua hissa
+    elapsed = (now % window) / window
+    count = counts.get(keys[0], 0) + counts.get(keys[1], 0) * (1 - elapsed)
+    if count < limit:
+        return 0
+    _incr(STATS_RATE_LIMITED)
+    return max(1, int(window - now % window))
+
+
+def record_post(user, kind):
+    _, window = _config()["RATE_LIMITS"][kind]
+    _incr(_rate_key(kind, user.pk, int(time.time() // window)), timeout=window * 2)
+
+
+def get_stats():
+    stats = cache.get_many([STATS_BLOCKED, STATS_RATE_LIMITED])
+    return {
+        "blocked": stats.get(STATS_BLOCKED, 0),
+        "rate_limited": stats.get(STATS_RATE_LIMITED, 0),
+    }
@@ -0,0 +1,180 @@
+import atexit
+import logging
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Comment, Notification, Question
+from .utils import jobs
+
+logger = logging.getLogger(__name__)
+
+# Naye comment pe question author + thread ke baaki participants ko
+# notification. Comment save path sirf in-memory buffer me append karta hai;
+# NOTIFICATION_FLUSH_DELAY ke baad background job poora batch ek saath likhta
+# hai (ek UPDATE + ek bulk INSERT), aur ek thread pe aaye burst ek hi unread
+# row me coalesce ho jaate hain.
+
+UNREAD_KEY = "notifications:unread:{}"
+UNREAD_TIMEOUT = 60 * 60
+
+_pending = []
+_pending_lock = threading.Lock()
+_flush_timer = None
+
+
+def unread_count(user_id):
+    key = UNREAD_KEY.format(user_id)
+    count = cache.get(key)
+    if count is None:
+        count = Notification.objects.filter(
+            user_id=user_id, read_at__isnull=True, question__deleted_at__isnull=True
+        ).count()
+        cache.set(key, count, UNREAD_TIMEOUT)
+    return count
+
+
+def invalidate_unread(user_ids):
+    cache.delete_many([UNREAD_KEY.format(uid) for uid in user_ids])
+
+
+def mark_read(user_id, notification_ids=None):
+    rows = Notification.objects.filter(user_id=user_id, read_at__isnull=True)
+    if notification_ids is not None:
+        rows = rows.filter(id__in=notification_ids)
+    updated = rows.update(read_at=timezone.now())
+    invalidate_unread([user_id])
+    return updated
+
+
+def _insert_or_bump(rows):
+    try:
+        with transaction.atomic():
+            Notification.objects.bulk_create(rows)
+        return
+    except IntegrityError:
+        pass
+    # Doosre process ne beech me unread row bana di: row-by-row, conflict
+    # wali row ka count usi row me jodo (drop nahi)
+    for row in rows:
+        row.pk = None
+        try:
+            with transaction.atomic():
+                row.save(force_insert=True)
+        except IntegrityError:
+            Notification.objects.filter(
+                question_id=row.question_id, user_id=row.user_id, read_at__isnull=True
+            ).update(count=F("count") + row.count, last_comment_id=row.last_comment_id, updated_at=row.updated_at)
+
+
+def fan_out(comments):
+    """Write notifications for a batch of (comment_id, question_id, author_id)."""
+    by_question = defaultdict(list)
+    for comment_id, question_id, author_id in comments:
+        by_question[question_id].append((comment_id, author_id))
+
+    # Participants = question author + jinhone thread pe comment kiya
+    participants = defaultdict(set)
+    for question_id, owner_id in Question.objects.filter(id__in=by_question).values_list("id", "user_id"):
+        participants[question_id].add(owner_id)
+    for question_id, author_id in (
+        Comment.objects.filter(question_id__in=list(participants)).values_list("question_id", "author_id").distinct()
+    ):
+        participants[question_id].add(author_id)
+
+    now = timezone.now()
+    touched = set()
+    with transaction.atomic():
+        for question_id, items in by_question.items():
+            if question_id not in participants:
+                continue  # question delete ho gaya
+            last_comment_id = max(cid for cid, _ in items)
+            # Har recipient ke liye: is batch me doosron ke kitne comments aaye
+            counts = {}
+            for uid in participants[question_id]:
+                n = sum(1 for _, author_id in items if author_id != uid)
+                if n:
+                    counts[uid] = n
+            if not counts:
+                continue
+
+            existing = set(
+                Notification.objects.filter(
+                    question_id=question_id, user_id__in=counts, read_at__isnull=True
+                ).values_list("user_id", flat=True)
+            )
+            # Same count wale users ek hi UPDATE me
+            by_count = defaultdict(list)
+            for uid in existing:
+                by_count[counts[uid]].append(uid)
+            for n, uids in by_count.items():
+                Notification.objects.filter(
+                    question_id=question_id, user_id__in=uids, read_at__isnull=True
+                ).update(count=F("count") + n, last_comment_id=last_comment_id, updated_at=now)
+
+            _insert_or_bump([
+                Notification(user_id=uid, question_id=question_id, last_comment_id=last_comment_id,
+                             count=n, updated_at=now)
+                for uid, n in counts.items() if uid not in existing
+            ])
+            touched.update(counts)
+
+    invalidate_unread(touched)
+    return len(touched)
+
+
+def _flush():
+    global _flush_timer
+    with _pending_lock:
+        batch = _pending[:]
+        _pending.clear()
+        _flush_timer = None
+    if batch:
+        jobs.submit(fan_out, batch)
+
+
+def flush_pending():
+    # Worker exit (max_requests recycle / deploy): timer ka wait mat karo,
+    # pending batch isi thread me likh do
+    global _flush_timer
+    with _pending_lock:
+        batch = _pending[:]
+        _pending.clear()
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+    if batch:
+        try:
+            fan_out(batch)
+        except Exception as e:
+            logger.warning("notifications: %s pending items lost at exit: %s", len(batch), e)
+
+
+atexit.register(flush_pending)
+
+
+def enqueue(comment):
+    global _flush_timer
+    item = (comment.pk, comment.question_id, comment.author_id)
+    if getattr(settings, "BACKGROUND_JOBS_SYNC", False):
+        fan_out([item])
+        return
+    with _pending_lock:
+        _pending.append(item)
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(getattr(settings, "NOTIFICATION_FLUSH_DELAY", 2.0), _flush)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+@receiver(post_save, sender=Comment)
+def notify_new_comment(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(lambda: enqueue(instance))
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import re
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from django.template.loader import render_to_string
+
+from .models import Comment, Question, soft_deleted
+from .utils import pubsub
+
+# Live comments: Comment save/soft-delete pe ek baar rendered HTML delta
+# publish hota hai, helpdesk/asgi.py ka SSE stream use har open
+# view_question page tak bhejta hai.
+
+EVENTS_PATH = re.compile(r"^/events/question/(\d+)/$")
+
+
+def channel_for(question_id):
+    return f"question:{question_id}"
+
+
+def _live(question_id):
+    # WSGI pe koi stream nahi sunta; render/publish ka kaam bekaar hai
+    return settings.REALTIME_ENABLED and pubsub.has_subscribers(channel_for(question_id))
+
+
+def _publish_on_commit(question_id, payload):
+    message = json.dumps(payload)
+    transaction.on_commit(lambda: pubsub.publish(channel_for(question_id), message))
+
+
+@receiver(post_save, sender=Comment)
+def publish_comment_saved(sender, instance, created, **kwargs):
+    if instance.deleted_at is not None or not _live(instance.question_id):
+        return
+    # request ke bina render: edit/delete buttons nahi aate (reload pe aa jaate hain)
+    html = render_to_string("partials/comment.html", {"comment": instance})
+    _publish_on_commit(instance.question_id, {
+        "action": "created" if created else "updated",
+        "id": instance.pk,
+        "html": html,
+    })
+
+
+@receiver(soft_deleted, sender=Comment)
+def publish_comments_deleted(sender, pks, **kwargs):
+    if not settings.REALTIME_ENABLED:
+        return
+    for comment_id, question_id in Comment.all_objects.filter(pk__in=pks).values_list("pk", "question_id"):
+        _publish_on_commit(question_id, {"action": "deleted", "id": comment_id})
+
+
+# ---- ASGI side ----
+
+async def _send_text(send, text, more_body=True):
+    await send({"type": "http.response.body", "body": text.encode(), "more_body": more_body})
+
+
+async def question_stream(scope, receive, send, question_id):
+    """Server-sent events for one question; one coroutine + queue per client."""
+    if not await Question.objects.filter(pk=question_id).aexists():
+        await send({"type": "http.response.start", "status": 404, "headers": [(b"content-type", b"text/plain")]})
+        await _send_text(send, "Not found", more_body=False)
+        return
+
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [
+            (b"content-type", b"text/event-stream"),
+            (b"cache-control", b"no-cache"),
+            (b"x-accel-buffering", b"no"),  # proxy buffering band
+        ],
+    })
+    await _send_text(send, "retry: 5000\n\n")
+
+    heartbeat = getattr(settings, "REALTIME_HEARTBEAT", 25)
+    sub = pubsub.subscribe(channel_for(question_id))
+    disconnect = asyncio.ensure_future(_wait_disconnect(receive))
+    try:
+        while not sub.overflowed:
+            message = asyncio.ensure_future(sub.get())
+            done, _ = await asyncio.wait({message, disconnect}, timeout=heartbeat, return_when=asyncio.FIRST_COMPLETED)
+            if disconnect in done:
+                message.cancel()
+                break
+            if message in done:
+                await _send_text(send, f"event: comment\ndata: {message.result()}\n\n")
+            else:
+                message.cancel()
+                # Idle connection ko proxies band na karein
+                await _send_text(send, ": ping\n\n")
+        if not disconnect.done():
+            await _send_text(send, "", more_body=False)
+    except OSError:
+        pass  # client chala gaya
+    finally:
+        sub.close()
+        disconnect.cancel()
+
+
+async def _wait_disconnect(receive):
+    while True:
+        event = await receive()
+        if event["type"] == "http.disconnect":
+            return
@@ -0,0 +1,93 @@
+from collections import Counter
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F
+from django.dispatch import receiver
+from django.utils.text import slugify
+
+from .models import Question, QuestionTag, Tag, soft_deleted
+
+# Tag helpers: question_count har add/remove pe F() se +/- hota hai, full
+# COUNT kabhi nahi (drift ho to `manage.py recount_tags`).
+
+MAX_TAGS = 5
+CLOUD_KEY = "tags:cloud"
+CLOUD_SIZE = 40
+CLOUD_TIMEOUT = 10 * 60
+
+
+def parse_tags(text):
+    """'Django, python ,django' -> {'django': 'Django', 'python': 'python'} (slug -> name)."""
+    tags = {}
+    for raw in (text or "").split(","):
+        name = raw.strip()[:50]
+        slug = slugify(name)[:50]
+        if slug and slug not in tags:
+            tags[slug] = name
+        if len(tags) >= MAX_TAGS:
+            break
+    return tags
+
+
+def _bump(counts):
+    # {tag_id: delta} -> ek UPDATE per distinct delta
+    by_delta = {}
+    for tag_id, delta in counts.items():
+        if delta:
+            by_delta.setdefault(delta, []).append(tag_id)
+    for delta, tag_ids in by_delta.items():
+        Tag.objects.filter(id__in=tag_ids).update(question_count=F("question_count") + delta)
+    if by_delta:
+        cache.delete(CLOUD_KEY)
+
+
+@transaction.atomic
+def set_question_tags(question, text):
+    wanted = parse_tags(text)
+
+    existing = {t.slug: t for t in Tag.objects.filter(slug__in=wanted)}
+    missing = [Tag(slug=slug, name=name) for slug, name in wanted.items() if slug not in existing]
+    if missing:
+        Tag.objects.bulk_create(missing, ignore_conflicts=True)
+        existing = {t.slug: t for t in Tag.objects.filter(slug__in=wanted)}
+    wanted_ids = {t.id for t in existing.values()}
+
+    current_ids = set(QuestionTag.objects.filter(question=question).values_list("tag_id", flat=True))
+    added = wanted_ids - current_ids
+    removed = current_ids - wanted_ids
+
+    QuestionTag.objects.bulk_create([QuestionTag(question=question, tag_id=tid) for tid in added])
+    if removed:
+        QuestionTag.objects.filter(question=question, tag_id__in=removed).delete()
+    _bump({**{tid: 1 for tid in added}, **{tid: -1 for tid in removed}})
+
+
+def tag_text(question):
+    return ", ".join(t.name for t in question.tags.all())
+
+
+def release_questions(question_ids):
+    """Questions left the hot table (soft delete / archive): decrement their tags."""
+    counts = (
+        QuestionTag.objects.filter(question_id__in=question_ids)
+        .values("tag_id").annotate(n=Count("id"))
+    )
+    _bump(Counter({row["tag_id"]: -row["n"] for row in counts}))
+
+
+@receiver(soft_deleted, sender=Question)
+def release_deleted_questions(sender, pks, **kwargs):
+    release_questions(pks)
+
+
+def tag_cloud():
+    cloud = cache.get(CLOUD_KEY)
+    if cloud is None:
+        cloud = list(
+            Tag.objects.filter(question_count__gt=0)
+            .order_by("-question_count")
+            .values("name", "slug", "question_count")[:CLOUD_SIZE]
+        )
+        cache.set(CLOUD_KEY, cloud, CLOUD_TIMEOUT)
+    return cloud
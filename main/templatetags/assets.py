@@ -0,0 +1,12 @@
+from django import template
+from django.utils.html import format_html_join
+
+from ..utils.assets import stylesheet_urls
+
+register = template.Library()
+
+
+@register.simple_tag
+def css_bundle(name):
+    """{% css_bundle 'home' %} -> bundle ka <link>, ya build nahi hua to source CSS ke."""
+    return format_html_join("\n", '<link rel="stylesheet" href="{}">', ((url,) for url in stylesheet_urls(name)))
@@ -1,3 +1,412 @@
-from django.test import TestCase
+import math
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db.models.signals import post_delete
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from . import hot, moderation, notifications, realtime
+from .models import (
+    OTP, ArchivedComment, ArchivedQuestion, BlockedPattern, Comment, CustomUser, Notification, Profile, Question,
+)
+from .utils import assets, login_throttle, pubsub, purge
+
+LOCMEM = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+# Manifest storage ko collectstatic ka output chahiye; tests build artifacts pe depend na karein
+PLAIN_STATIC = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+
+class TrieRegexTests(SimpleTestCase):
+    def test_shared_prefixes_collapse(self):
+        self.assertEqual(moderation.trie_regex(["cheap pills", "cheap meds"]), r"cheap\ (?:meds|pills)")
+
+    def test_overlapping_prefix_matches_both(self):
+        matcher = moderation.compile_patterns([("spam", False), ("spammer", False)])
+        self.assertEqual(matcher.search("a spammer here").group(0), "spammer")
+        self.assertEqual(matcher.search("just spam").group(0), "spam")
+
+    def test_whole_word_vs_substring(self):
+        matcher = moderation.compile_patterns([("sex", True), ("casino", False)])
+        self.assertIsNone(matcher.search("essex county"))
+        self.assertEqual(matcher.search("sex now").group(0), "sex")
+        self.assertEqual(matcher.search("onlinecasinos.biz").group(0), "casino")
+
+    def test_regex_metacharacters_are_literal(self):
+        matcher = moderation.compile_patterns([("c++ (cheap)", False), ("a.b", False)])
+        self.assertIsNotNone(matcher.search("buy c++ (cheap) today"))
+        self.assertIsNone(matcher.search("axb"))
+
+    def test_patterns_are_normalized(self):
+        matcher = moderation.compile_patterns([("  Cheap   PILLS ", True)])
+        self.assertIsNotNone(matcher.search(moderation.normalize("CHEAP\n pills")))
+
+    def test_empty_list(self):
+        self.assertIsNone(moderation.compile_patterns([("  ", True)]))
+
+
+@override_settings(CACHES=LOCMEM, MODERATION={"RATE_LIMITS": {"comment": (3, 100)}})
+class RateLimitTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = mock.Mock(pk=1, is_staff=False)
+
+    def post_at(self, now):
+        with mock.patch("main.moderation.time.time", return_value=now):
+            moderation.record_post(self.user, "comment")
+
+    def wait_at(self, now):
+        with mock.patch("main.moderation.time.time", return_value=now):
+            return moderation.rate_limited(self.user, "comment")
+
+    def test_limit_within_window(self):
+        for t in (1000, 1010, 1020):
+            self.assertEqual(self.wait_at(t), 0)
+            self.post_at(t)
+        self.assertEqual(self.wait_at(1030), 70)
+
+    def test_previous_bucket_decays(self):
+        for t in (1050, 1060, 1070):
+            self.post_at(t)
+        # 1150: 50% of next bucket gone -> 3 * 0.5 = 1.5 < 3
+        self.assertEqual(self.wait_at(1150), 0)
+        # 1101: previous bucket still counts ~99%
+        self.post_at(1101)
+        self.assertGreater(self.wait_at(1101), 0)
+
+    def test_staff_exempt(self):
+        for t in (1000, 1001, 1002, 1003):
+            self.post_at(t)
+        self.user.is_staff = True
+        self.assertEqual(self.wait_at(1004), 0)
+
+
+@override_settings(CACHES=LOCMEM)
+class LoginThrottleWindowTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_sliding_window_weights_previous_bucket(self):
+        cache.set_many({
+            "login_throttle:count:user:x:10": 4,   # current bucket (now // 100 == 10)
+            "login_throttle:count:user:x:9": 10,   # previous bucket
+        })
+        self.assertAlmostEqual(login_throttle._window_count("user:x", 1025, 100), 4 + 10 * 0.75)
+        self.assertAlmostEqual(login_throttle._window_count("user:x", 1000, 100), 14)
+
+    def test_empty(self):
+        self.assertEqual(login_throttle._window_count("user:none", 1000, 100), 0)
+
+
+@override_settings(HOT_QUESTIONS={"HALF_LIFE_HOURS": 1})
+class HotScoreTests(SimpleTestCase):
+    now = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+
+    def decayed(self, score, at):
+        # score log2 space me hai: `at` pe actual weight
+        return 2 ** (score - at.timestamp() / 3600)
+
+    def test_events_add_in_linear_space(self):
+        score = hot.add_score(None, 3, self.now)
+        score = hot.add_score(score, 5, self.now)
+        self.assertAlmostEqual(self.decayed(score, self.now), 8)
+
+    def test_half_life(self):
+        score = hot.add_score(None, 4, self.now)
+        self.assertAlmostEqual(self.decayed(score, self.now + timedelta(hours=1)), 2)
+
+    def test_recent_event_outranks_older_heavier_one(self):
+        old = hot.add_score(None, 10, self.now - timedelta(hours=4))  # 10 / 16 abhi
+        new = hot.add_score(None, 1, self.now)
+        self.assertGreater(new, old)
+
+    def test_no_overflow_for_far_apart_events(self):
+        score = hot.add_score(None, 1, self.now - timedelta(days=3650))
+        score = hot.add_score(score, 1, self.now)
+        self.assertTrue(math.isfinite(score))
+
+
+@override_settings(CACHES=LOCMEM, STORAGES=PLAIN_STATIC)
+class ModerationViewTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        moderation._matcher_version = None
+        self.user = CustomUser.objects.create_user(username="bob", password="pw", phone="1")
+        self.question = Question.objects.create(user=self.user, title="t", body="b", description="d")
+        BlockedPattern.objects.create(pattern="cheap pills")
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def test_ask_rejects_spam_before_write(self):
+        response = self.client.post("/ask/", {"title": "Cheap  Pills here", "description": "d"})
+        self.assertContains(response, "spam filter")
+        self.assertEqual(Question.objects.count(), 1)
+
+    def test_edit_rejects_spam(self):
+        response = self.client.post(f"/question/{self.question.pk}/edit/",
+                                    {"title": "cheap pills", "description": "d", "tags": ""})
+        self.assertEqual(response.status_code, 400)
+        self.question.refresh_from_db()
+        self.assertEqual(self.question.title, "t")
+
+    def test_comment_rejects_spam(self):
+        self.client.post(f"/question/{self.question.pk}/", {"content": "cheap pills"})
+        self.assertFalse(self.question.comments.exists())
+
+    def test_deleted_pattern_stops_matching(self):
+        self.assertEqual(moderation.find_blocked("cheap pills"), "cheap pills")
+        BlockedPattern.objects.all().delete()
+        self.assertIsNone(moderation.find_blocked("cheap pills"))
+
+
+@override_settings(DEBUG=True, STORAGES=PLAIN_STATIC)
+class StylesheetFallbackTests(SimpleTestCase):
+    def urls(self, name, built):
+        with mock.patch("main.utils.assets.finders.find", side_effect=lambda path: path in built):
+            return assets.stylesheet_urls(name)
+
+    def test_built_bundle_is_linked_alone(self):
+        self.assertEqual(self.urls("home", {"bundles/home.min.css"}), ["/static/bundles/home.min.css"])
+
+    def test_sources_linked_without_build(self):
+        self.assertEqual(self.urls("home", {"css/home.css"}), ["/static/css/home.css"])
+        # vendor files nahi hain to CDN
+        self.assertEqual(self.urls("site", {"css/base.css"}), [
+            assets.VENDOR["vendor/animate/animate.min.css"],
+            assets.VENDOR["vendor/bootstrap-icons/bootstrap-icons.min.css"],
+            "/static/css/base.css",
+        ])
+
+
+class PreviewKindTests(SimpleTestCase):
+    def test_stored_kind_wins(self):
+        self.assertEqual(Question(file="uploads/a.png", file_kind="other").preview_kind, "other")
+
+    def test_extension_fallback_before_backfill(self):
+        self.assertEqual(Question(file="uploads/A.PDF").preview_kind, "pdf")
+        self.assertEqual(Question(file="uploads/photo.jpeg").preview_kind, "image")
+        self.assertEqual(Question(file="uploads/notes.txt").preview_kind, "other")
+        self.assertEqual(Question().preview_kind, "")
+
+
+# Sync jobs: notification/hot timers test ke baad pending na rahein
+@override_settings(STORAGES=PLAIN_STATIC, BACKGROUND_JOBS_SYNC=True)
+class LiveCommentPublishTests(TestCase):
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(username="ann", password="pw", phone="2")
+        self.question = Question.objects.create(user=self.user, title="t", body="b", description="d")
+
+    def save_comment(self):
+        with mock.patch("main.realtime.render_to_string", return_value="<div></div>") as render, \
+                mock.patch("main.realtime.pubsub.publish") as publish, \
+                self.captureOnCommitCallbacks(execute=True):
+            Comment.objects.create(question=self.question, author=self.user, content="hi")
+        return render, publish
+
+    @override_settings(REALTIME_ENABLED=False)
+    def test_no_render_when_realtime_disabled(self):
+        render, publish = self.save_comment()
+        render.assert_not_called()
+        publish.assert_not_called()
+
+    @override_settings(REALTIME_ENABLED=True)
+    def test_no_render_without_subscribers(self):
+        with mock.patch("main.realtime.pubsub.has_subscribers", return_value=False):
+            render, publish = self.save_comment()
+        render.assert_not_called()
+        publish.assert_not_called()
+
+    @override_settings(REALTIME_ENABLED=True)
+    def test_published_to_open_pages(self):
+        with mock.patch("main.realtime.pubsub.has_subscribers", return_value=True):
+            render, publish = self.save_comment()
+        render.assert_called_once()
+        self.assertEqual(publish.call_args.args[0], realtime.channel_for(self.question.pk))
+
+
+class MediaTestCase(TestCase):
+    """Har test apna temp MEDIA_ROOT; files asli media/ me nahi jaatin."""
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+    def stored(self, fieldfile):
+        return fieldfile.storage.exists(fieldfile.name)
+
+
+class PurgeTests(MediaTestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = CustomUser.objects.create_user(username="gone", password="pw", phone="3")
+        self.other = CustomUser.objects.create_user(username="stays", password="pw", phone="4")
+
+    def purge(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            return purge.purge_deleted(batch_size=2)
+
+    def test_user_content_rows_and_files_removed_live_untouched(self):
+        own_q = Question.objects.create(user=self.user, title="t", body="b", description="d",
+                                        file=ContentFile(b"q", name="q.txt"))
+        reply = Comment.objects.create(question=own_q, author=self.other, content="c")
+        live_q = Question.objects.create(user=self.other, title="t", body="b", description="d")
+        mine = Comment.objects.create(question=live_q, author=self.user, content="c",
+                                      file=ContentFile(b"c", name="c.txt"))
+        live_c = Comment.objects.create(question=live_q, author=self.other, content="c",
+                                        file=ContentFile(b"l", name="l.txt"))
+        OTP.objects.create(user=self.user, code="123456")
+        profile = Profile.objects.get(user=self.user)
+        profile.profile_picture = ContentFile(b"p", name="p.png")
+        profile.save()
+
+        purge.soft_delete_user(self.user)
+        self.purge()
+
+        self.assertFalse(CustomUser.objects.filter(pk=self.user.pk).exists())
+        self.assertFalse(Question.all_objects.filter(pk=own_q.pk).exists())
+        self.assertFalse(Comment.all_objects.filter(pk__in=[reply.pk, mine.pk]).exists())
+        self.assertFalse(OTP.objects.filter(user_id=self.user.pk).exists())
+        for fieldfile in (own_q.file, mine.file, profile.profile_picture):
+            self.assertFalse(self.stored(fieldfile))
+
+        self.assertTrue(Question.objects.filter(pk=live_q.pk).exists())
+        self.assertTrue(Comment.objects.filter(pk=live_c.pk).exists())
+        self.assertTrue(self.stored(live_c.file))
+        self.assertTrue(Profile.objects.filter(user=self.other).exists())
+
+    def test_delete_order_children_before_parents(self):
+        own_q = Question.objects.create(user=self.user, title="t", body="b", description="d")
+        Comment.objects.create(question=own_q, author=self.other, content="c")
+        live_q = Question.objects.create(user=self.other, title="t", body="b", description="d")
+        for _ in range(3):
+            Comment.objects.create(question=live_q, author=self.user, content="c")
+        OTP.objects.create(user=self.user, code="123456")
+
+        deleted = []
+        tracked = {Comment, Question, OTP, Profile, CustomUser}
+
+        def record(sender, **kwargs):
+            if sender in tracked and (not deleted or deleted[-1] != sender.__name__):
+                deleted.append(sender.__name__)
+
+        post_delete.connect(record)
+        self.addCleanup(post_delete.disconnect, record)
+        purge.soft_delete_user(self.user)
+        self.purge()
+        self.assertEqual(deleted, ["Comment", "Question", "OTP", "Profile", "CustomUser"])
+
+    def test_deleted_user_takes_archived_threads_and_files(self):
+        now = timezone.now()
+        own = ArchivedQuestion.objects.create(
+            id=100, user=self.user, title="t", body="b", description="d",
+            file=ContentFile(b"q", name="q.txt"), created_at=now, last_activity_at=now,
+        )
+        others = ArchivedQuestion.objects.create(
+            id=101, user=self.other, title="t", body="b", description="d", created_at=now, last_activity_at=now,
+        )
+        reply = ArchivedComment.objects.create(id=200, question=own, author=self.other, content="c", created_at=now)
+        mine = ArchivedComment.objects.create(
+            id=201, question=others, author=self.user, content="c",
+            file=ContentFile(b"c", name="c.txt"), created_at=now,
+        )
+        purge.soft_delete_user(self.user)
+        self.purge()
+
+        self.assertFalse(CustomUser.objects.filter(pk=self.user.pk).exists())
+        self.assertFalse(ArchivedQuestion.objects.filter(pk=own.pk).exists())
+        self.assertFalse(ArchivedComment.objects.filter(pk__in=[reply.pk, mine.pk]).exists())
+        self.assertFalse(self.stored(own.file))
+        self.assertFalse(self.stored(mine.file))
+        self.assertTrue(ArchivedQuestion.objects.filter(pk=others.pk).exists())
+
+
+class GcMediaTests(MediaTestCase):
+    def setUp(self):
+        super().setUp()
+        user = CustomUser.objects.create_user(username="owner", password="pw", phone="5")
+        self.question = Question.objects.create(user=user, title="t", body="b", description="d",
+                                                file=ContentFile(b"q", name="kept.txt"))
+        self.orphan = os.path.join(self.media_root, "uploads", "orphan.txt")
+        self.default_picture = os.path.join(self.media_root, "profile_pics", "default.png")
+        for path in (self.orphan, self.default_picture):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(b"x")
+
+    def gc(self, *args):
+        out = StringIO()
+        call_command("gc_media", "--min-age", "0", *args, stdout=out)
+        return out.getvalue()
+
+    def test_dry_run_only_lists(self):
+        out = self.gc("--dry-run")
+        self.assertIn("orphan: uploads/orphan.txt", out)
+        self.assertNotIn(self.question.file.name, out)
+        self.assertTrue(os.path.exists(self.orphan))
+
+    def test_removes_orphans_keeps_referenced(self):
+        self.gc("--batch-size", "1")
+        self.assertFalse(os.path.exists(self.orphan))
+        self.assertTrue(self.stored(self.question.file))
+        self.assertTrue(os.path.exists(self.default_picture))
+
+    def test_recent_files_skipped(self):
+        call_command("gc_media", stdout=StringIO())  # default --min-age 3600
+        self.assertTrue(os.path.exists(self.orphan))
+
+
+@override_settings(CACHES=LOCMEM, BACKGROUND_JOBS_SYNC=True)
+class NotificationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = CustomUser.objects.create_user(username="owner", password="pw", phone="6")
+        self.commenter = CustomUser.objects.create_user(username="guest", password="pw", phone="7")
+        self.question = Question.objects.create(user=self.owner, title="t", body="b", description="d")
+
+    def comment(self, author):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Comment.objects.create(question=self.question, author=author, content="c")
+
+    def test_comments_on_one_thread_coalesce(self):
+        first = Comment.objects.create(question=self.question, author=self.commenter, content="c")
+        second = Comment.objects.create(question=self.question, author=self.commenter, content="c")
+        notifications.fan_out([
+            (first.pk, self.question.pk, self.commenter.pk),
+            (second.pk, self.question.pk, self.commenter.pk),
+        ])
+        row = Notification.objects.get(user=self.owner)
+        self.assertEqual(row.count, 2)
+        self.assertEqual(row.last_comment_id, second.pk)
+
+    def test_later_comment_bumps_unread_row(self):
+        self.comment(self.commenter)
+        self.comment(self.commenter)
+        self.assertEqual(Notification.objects.filter(user=self.owner, read_at__isnull=True).count(), 1)
+        self.assertEqual(Notification.objects.get(user=self.owner).count, 2)
+
+    def test_commenter_not_notified_of_own_comment(self):
+        self.comment(self.commenter)
+        self.assertFalse(Notification.objects.filter(user=self.commenter).exists())
+        # Owner apne thread pe likhe to bhi khud ko nahi
+        self.comment(self.owner)
+        self.assertEqual(Notification.objects.get(user=self.owner).count, 1)
+        self.assertEqual(Notification.objects.get(user=self.commenter).count, 1)
+
+    def test_mark_read_invalidates_cached_count(self):
+        self.comment(self.commenter)
+        self.assertEqual(notifications.unread_count(self.owner.pk), 1)
+        notifications.mark_read(self.owner.pk)
+        self.assertEqual(notifications.unread_count(self.owner.pk), 0)
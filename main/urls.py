@@ -11,6 +11,7 @@ urlpatterns = [
     path('question/<int:id>/', views.view_question, name='view_question'),
     path('ask/', views.ask_question, name='ask_question'),
     path('search/', views.search_questions, name='search_questions'),
+    path('tag/<slug:slug>/', views.tag_detail, name='tag_detail'),
     path('question/<int:pk>/edit/', views.edit_question, name='edit_question'),
     path('question/<int:pk>/delete/', views.delete_question, name='delete_question'),
     path('delete-file/<int:id>/', views.delete_question_file, name='delete_file'),
@@ -19,4 +20,7 @@ urlpatterns = [
     path("profile/", views.profile, name="profile"),
     path("remove-dp/", views.remove_profile_pic, name="remove_profile_pic"),
     path("ai/suggest/<int:question_id>/", views.ai_suggest, name="ai_suggest"),
+    path("metrics/", views.metrics, name="metrics"),
+    path("notifications/", views.notification_list, name="notifications"),
+    path("notifications/<int:pk>/open/", views.open_notification, name="open_notification"),
 ]
@@ -0,0 +1,56 @@
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.staticfiles import finders
+from django.templatetags.static import static
+
+# CSS bundles ki definition (build_assets yahi se padhta hai) aur template ke
+# liye links. Bundle build hua hai to ek minified file, warna (fresh checkout,
+# build_assets nahi chala) source CSS seedhe link hoti hai aur vendor files
+# CDN se, taaki runserver bina build ke bhi styled rahe.
+
+CDNJS = "https://cdnjs.cloudflare.com/ajax/libs"
+VENDOR = {
+    "vendor/animate/animate.min.css": f"{CDNJS}/animate.css/4.1.1/animate.min.css",
+    "vendor/bootstrap-icons/bootstrap-icons.min.css": f"{CDNJS}/bootstrap-icons/1.11.1/font/bootstrap-icons.min.css",
+    "vendor/bootstrap-icons/fonts/bootstrap-icons.woff2": f"{CDNJS}/bootstrap-icons/1.11.1/font/fonts/bootstrap-icons.woff2",
+    "vendor/bootstrap-icons/fonts/bootstrap-icons.woff": f"{CDNJS}/bootstrap-icons/1.11.1/font/fonts/bootstrap-icons.woff",
+}
+
+# bundle name -> source files (main/static ke relative), order matters
+SITE = [
+    "vendor/animate/animate.min.css",
+    "vendor/bootstrap-icons/bootstrap-icons.min.css",
+    "css/base.css",
+]
+PAGES = [
+    "home", "login", "signup", "profile", "search_results",
+    "edit_comment", "edit_question", "view_question", "verify_otp",
+]
+BUNDLES = {"site": SITE, **{page: [f"css/{page}.css"] for page in PAGES}}
+
+
+def bundle_path(name):
+    return f"bundles/{name}.min.css"
+
+
+def _source_paths(name):
+    """(path, is_static) list: bundle, ya bundle nahi bana to uske sources."""
+    if finders.find(bundle_path(name)):
+        return [(bundle_path(name), True)]
+    paths = []
+    for src in BUNDLES[name]:
+        if finders.find(src):
+            paths.append((src, True))
+        elif src in VENDOR:
+            paths.append((VENDOR[src], False))
+    return paths
+
+
+_cached_source_paths = lru_cache(maxsize=None)(_source_paths)
+
+
+def stylesheet_urls(name):
+    # DEBUG me har baar dekho (build_assets beech me chal sakta hai)
+    paths = _source_paths(name) if settings.DEBUG else _cached_source_paths(name)
+    return [static(path) if is_static else path for path, is_static in paths]
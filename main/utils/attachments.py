@@ -0,0 +1,116 @@
+import mimetypes
+
+# Attachment metadata upload ke time ek baar nikaalo (magic bytes se, naam
+# pe bharosa nahi), taaki template har render pe file.url ko parse na kare.
+
+KIND_IMAGE = "image"
+KIND_PDF = "pdf"
+KIND_OTHER = "other"
+
+META_FIELDS = ["file_kind", "file_mime", "file_size", "file_width", "file_height"]
+
+# (offset, magic bytes, mime type)
+SIGNATURES = [
+    (0, b"%PDF-", "application/pdf"),
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"GIF87a", "image/gif"),
+    (0, b"GIF89a", "image/gif"),
+    (8, b"WEBP", "image/webp"),
+]
+
+
+def sniff_mime(head, name=""):
+    for offset, magic, mime in SIGNATURES:
+        if head[offset:offset + len(magic)] == magic:
+            # RIFF container me WEBP hi chahiye, baaki (wav/avi) nahi
+            if mime == "image/webp" and not head.startswith(b"RIFF"):
+                continue
+            return mime
+    guessed, _ = mimetypes.guess_type(name)
+    # Naam se image/pdf mat maano, bytes match nahi hue to generic
+    if guessed and not guessed.startswith("image/") and guessed != "application/pdf":
+        return guessed
+    return "application/octet-stream"
+
+
+def kind_for_mime(mime):
+    if mime == "application/pdf":
+        return KIND_PDF
+    if mime.startswith("image/"):
+        return KIND_IMAGE
+    return KIND_OTHER
+
+
+# Backfill se pehle ke rows (file_kind khali) ke liye, purane template jaisa
+# extension se andaza; sirf preview dikhane ke liye, stored kind nahi banta
+PREVIEW_EXTENSIONS = {".pdf": KIND_PDF, ".png": KIND_IMAGE, ".jpg": KIND_IMAGE, ".jpeg": KIND_IMAGE}
+
+
+def kind_for_name(name):
+    _, dot, ext = (name or "").rpartition(".")
+    return PREVIEW_EXTENSIONS.get(f".{ext.lower()}" if dot else "", KIND_OTHER)
+
+
+def image_size(fileobj):
+    try:
+        from PIL import Image
+        fileobj.seek(0)
+        with Image.open(fileobj) as img:  # sirf header padhta hai
+            return img.size
+    except Exception:
+        return None, None
+    finally:
+        fileobj.seek(0)
+
+
+def inspect(fileobj, name=""):
+    fileobj.seek(0)
+    head = fileobj.read(32)
+    fileobj.seek(0)
+
+    mime = sniff_mime(head, name)
+    kind = kind_for_mime(mime)
+    width = height = None
+    if kind == KIND_IMAGE:
+        width, height = image_size(fileobj)
+
+    return {
+        "file_kind": kind,
+        "file_mime": mime,
+        "file_size": getattr(fileobj, "size", None),
+        "file_width": width,
+        "file_height": height,
+    }
+
+
+def clear_meta(instance):
+    instance.file_kind = ""
+    instance.file_mime = ""
+    instance.file_size = None
+    instance.file_width = None
+    instance.file_height = None
+
+
+def refresh_meta(instance, force=False):
+    """Update attachment fields on ``instance`` if its file was just uploaded."""
+    f = instance.file
+    if not f:
+        clear_meta(instance)
+        return True
+    # Pehle se stored file ka meta already saved hai
+    if getattr(f, "_committed", True) and not force:
+        return False
+
+    if force:
+        f.open("rb")
+        try:
+            meta = inspect(f.file, f.name)
+            meta["file_size"] = f.size
+        finally:
+            f.close()
+    else:
+        meta = inspect(f.file, f.name)
+    for field, value in meta.items():
+        setattr(instance, field, value)
+    return True
@@ -0,0 +1,73 @@
+import logging
+
+from django.db import transaction
+
+from main.models import Comment, Question
+from . import jobs, purge
+
+logger = logging.getLogger(__name__)
+
+# Admin bulk actions ek badi transaction ki jagah background me pk-order
+# chunks me chalte hain (har chunk apni chhoti transaction).
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def iter_pk_chunks(queryset, chunk_size=DEFAULT_CHUNK_SIZE):
+    # Keyset pagination on pk: OFFSET nahi, har chunk index seek hai
+    queryset = queryset.order_by("pk")
+    last_pk = None
+    while True:
+        page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        pks = list(page.values_list("pk", flat=True)[:chunk_size])
+        if not pks:
+            return
+        yield pks
+        last_pk = pks[-1]
+
+
+def update_in_chunks(queryset, values, chunk_size=DEFAULT_CHUNK_SIZE):
+    model = queryset.model
+    total = 0
+    for pks in iter_pk_chunks(queryset, chunk_size):
+        with transaction.atomic():
+            total += model._base_manager.filter(pk__in=pks).update(**values)
+    logger.info("bulk update %s %s: %s rows", model.__name__, values, total)
+    return total
+
+
+def delete_in_chunks(queryset, chunk_size=DEFAULT_CHUNK_SIZE):
+    model = queryset.model
+    total = 0
+    for pks in iter_pk_chunks(queryset, chunk_size):
+        with transaction.atomic():
+            total += model._base_manager.filter(pk__in=pks).delete()[0]
+    logger.info("bulk delete %s: %s rows", model.__name__, total)
+    return total
+
+
+def soft_delete_in_chunks(queryset, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Soft-delete rows (users with their content) and let the purge job cascade."""
+    model = queryset.model
+    total = 0
+    for pks in iter_pk_chunks(queryset, chunk_size):
+        if model in (Question, Comment):
+            total += model.objects.filter(pk__in=pks).soft_delete()
+        else:
+            for user in model._base_manager.filter(pk__in=pks):
+                purge.soft_delete_user(user)
+                total += 1
+    purge.purge_deleted()
+    return total
+
+
+def submit_update(queryset, values):
+    return jobs.submit(update_in_chunks, queryset, values)
+
+
+def submit_delete(queryset):
+    return jobs.submit(delete_in_chunks, queryset)
+
+
+def submit_soft_delete(queryset):
+    return jobs.submit(soft_delete_in_chunks, queryset)
@@ -0,0 +1,94 @@
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Bulkheads: har mehenge URL name (main/urls.py) ka apna concurrency cap.
+# Cap bhara hai to request QUEUE_TIMEOUT tak wait karti hai, phir 503 +
+# Retry-After (fail fast), taaki ai_suggest/SMTP jaise slow paths saare
+# worker threads na kha jaayein aur home jaisi sasti pages chalti rahein.
+# Caps per worker process hain (gunicorn threads ke saath matlab rakhte hain).
+
+DEFAULTS = {
+    "MAX_CONCURRENT": 4,
+    "QUEUE_TIMEOUT": 0.0,   # seconds; 0 = turant shed
+    "RETRY_AFTER": 5,       # seconds
+    "JSON": False,          # 503 body JSON me (fetch() wale endpoints)
+    "METHODS": None,        # e.g. ["POST"]: sirf in methods pe cap; None = sab
+}
+
+KEY_PREFIX = "bulkhead"
+
+
+class Bulkhead:
+    def __init__(self, name, conf):
+        self.name = name
+        self.max_concurrent = conf["MAX_CONCURRENT"]
+        self.queue_timeout = conf["QUEUE_TIMEOUT"]
+        self.retry_after = conf["RETRY_AFTER"]
+        self.json = conf["JSON"]
+        self.methods = set(conf["METHODS"]) if conf["METHODS"] else None
+        self._slots = threading.BoundedSemaphore(self.max_concurrent)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+
+    def acquire(self):
+        if self.queue_timeout > 0:
+            ok = self._slots.acquire(timeout=self.queue_timeout)
+        else:
+            ok = self._slots.acquire(blocking=False)
+        if ok:
+            with self._lock:
+                self.in_flight += 1
+        return ok
+
+    def release(self):
+        with self._lock:
+            self.in_flight -= 1
+        self._slots.release()
+
+
+_bulkheads = None
+_bulkheads_lock = threading.Lock()
+
+
+def get_bulkheads():
+    global _bulkheads
+    if _bulkheads is None:
+        with _bulkheads_lock:
+            if _bulkheads is None:
+                _bulkheads = {
+                    name: Bulkhead(name, {**DEFAULTS, **conf})
+                    for name, conf in getattr(settings, "BULKHEADS", {}).items()
+                }
+    return _bulkheads
+
+
+def for_request(request, url_name):
+    b = get_bulkheads().get(url_name)
+    if b is not None and b.methods and request.method not in b.methods:
+        return None
+    return b
+
+
+def record_shed(name):
+    key = f"{KEY_PREFIX}:shed:{name}"
+    # login_throttle jaisa: add() + incr() shared cache me, sab workers ka total
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, timeout=None)
+
+
+def get_stats():
+    bulkheads = get_bulkheads()
+    shed = cache.get_many([f"{KEY_PREFIX}:shed:{name}" for name in bulkheads])
+    return {
+        name: {
+            "max_concurrent": b.max_concurrent,
+            "in_flight": b.in_flight,  # sirf is process ka
+            "shed": shed.get(f"{KEY_PREFIX}:shed:{name}", 0),
+        }
+        for name, b in bulkheads.items()
+    }
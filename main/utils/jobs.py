@@ -0,0 +1,50 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+
+logger = logging.getLogger(__name__)
+
+# Chhota in-process background job runner: request se heavy kaam (cascade
+# delete, fan-out) response ke baad thread pool me chalta hai. Executor
+# lazily banta hai, isliye gunicorn preload ke fork ke baad hi thread start
+# hote hain. Durable backlog ke liye har job ka management command bhi hai
+# (cron se safety net).
+
+_executor = None
+_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, "BACKGROUND_JOBS_WORKERS", 2),
+                thread_name_prefix="bg-job",
+            )
+        return _executor
+
+
+def _run(fn, args, kwargs):
+    close_old_connections()
+    try:
+        return fn(*args, **kwargs)
+    except Exception:
+        logger.exception("background job %s failed", getattr(fn, "__name__", fn))
+    finally:
+        # Thread ka apna DB connection hota hai, leak mat karo
+        connection.close()
+
+
+def submit(fn, *args, **kwargs):
+    """Run ``fn`` in the background thread pool (inline if BACKGROUND_JOBS_SYNC)."""
+    if getattr(settings, "BACKGROUND_JOBS_SYNC", False):
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            logger.exception("background job %s failed", getattr(fn, "__name__", fn))
+            return None
+    return _get_executor().submit(_run, fn, args, kwargs)
@@ -0,0 +1,129 @@
+import hashlib
+import math
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+# Login throttling: per-username aur per-IP sliding window counters shared
+# cache me rakhe jaate hain, taaki har gunicorn worker same limits dekhe.
+# Locked-out request ko password hasher tak jaane hi nahi dete.
+
+DEFAULTS = {
+    "WINDOW": 300,          # seconds
+    "USERNAME_LIMIT": 5,    # failures per window per username
+    "IP_LIMIT": 20,         # failures per window per IP
+    "BASE_DELAY": 2,        # first lockout, seconds
+    "MAX_DELAY": 900,       # lockout cap, seconds
+}
+
+KEY_PREFIX = "login_throttle"
+STATS_REJECTED = f"{KEY_PREFIX}:stats:rejected"
+STATS_HASH_US_SAVED = f"{KEY_PREFIX}:stats:hash_us_saved"
+
+# Per-process moving average of one authenticate() call, in microseconds
+_avg_hash_us = None
+
+
+def _config():
+    conf = dict(DEFAULTS)
+    conf.update(getattr(settings, "LOGIN_THROTTLE", {}))
+    return conf
+
+
+def get_client_ip(request):
+    num_proxies = getattr(settings, "NUM_PROXIES", 0)
+    if num_proxies:
+        forwarded = request.META.get("HTTP_X_FORWARDED_FOR", "")
+        hops = [h.strip() for h in forwarded.split(",") if h.strip()]
+        if len(hops) >= num_proxies:
+            return hops[-num_proxies]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def _scopes(request, username):
+    conf = _config()
+    uname = hashlib.sha256((username or "").strip().lower().encode()).hexdigest()[:32]
+    return [
+        (f"user:{uname}", conf["USERNAME_LIMIT"]),
+        (f"ip:{get_client_ip(request)}", conf["IP_LIMIT"]),
+    ]
+
+
+def _incr(key, delta=1, timeout=None):
+    # add() + incr(): redis pe atomic; db cache pe incr get+set hai, chhota race counters ke liye chalega
+    cache.add(key, 0, timeout=timeout)
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        # key beech me expire ho gayi
+        cache.set(key, delta, timeout=timeout)
+        return delta
+
+
+def _window_count(scope, now, window):
+    # Sliding window counter: current bucket + previous bucket ka weighted hissa
+    bucket = int(now // window)
+    cur_key = f"{KEY_PREFIX}:count:{scope}:{bucket}"
+    prev_key = f"{KEY_PREFIX}:count:{scope}:{bucket - 1}"
+    counts = cache.get_many([cur_key, prev_key])
+    elapsed = (now % window) / window
+    return counts.get(cur_key, 0) + counts.get(prev_key, 0) * (1 - elapsed)
+
+
+def check(request, username):
+    """Return seconds to wait if this login attempt is locked out, else 0."""
+    now = time.time()
+    lock_keys = [f"{KEY_PREFIX}:lock:{scope}" for scope, _ in _scopes(request, username)]
+    locks = cache.get_many(lock_keys)
+    wait = max([until - now for until in locks.values()] + [0])
+    if wait <= 0:
+        return 0
+
+    _incr(STATS_REJECTED, timeout=None)
+    if _avg_hash_us:
+        _incr(STATS_HASH_US_SAVED, int(_avg_hash_us), timeout=None)
+    return math.ceil(wait)
+
+
+def register_failure(request, username):
+    conf = _config()
+    window = conf["WINDOW"]
+    now = time.time()
+    bucket = int(now // window)
+
+    for scope, limit in _scopes(request, username):
+        _incr(f"{KEY_PREFIX}:count:{scope}:{bucket}", timeout=window * 2)
+        count = _window_count(scope, now, window)
+        if count >= limit:
+            # Progressive delay: har extra failure pe lockout double
+            over = int(count - limit)
+            delay = min(conf["BASE_DELAY"] * (2 ** min(over, 16)), conf["MAX_DELAY"])
+            cache.set(f"{KEY_PREFIX}:lock:{scope}", now + delay, timeout=math.ceil(delay))
+
+
+def reset(request, username):
+    # Successful login ke baad username ka lock + failure counters hatao
+    # (warna ek typo pe phir lock), IP ka nahi
+    scope, _ = _scopes(request, username)[0]
+    bucket = int(time.time() // _config()["WINDOW"])
+    cache.delete_many([
+        f"{KEY_PREFIX}:lock:{scope}",
+        f"{KEY_PREFIX}:count:{scope}:{bucket}",
+        f"{KEY_PREFIX}:count:{scope}:{bucket - 1}",
+    ])
+
+
+def record_hash_time(seconds):
+    global _avg_hash_us
+    us = seconds * 1_000_000
+    _avg_hash_us = us if _avg_hash_us is None else (_avg_hash_us * 0.9 + us * 0.1)
+
+
+def get_stats():
+    stats = cache.get_many([STATS_REJECTED, STATS_HASH_US_SAVED])
+    return {
+        "rejected": stats.get(STATS_REJECTED, 0),
+        "hash_seconds_saved": round(stats.get(STATS_HASH_US_SAVED, 0) / 1_000_000, 3),
+        "avg_hash_ms": round((_avg_hash_us or 0) / 1000, 2),
+    }
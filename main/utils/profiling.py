@@ -0,0 +1,146 @@
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from . import jobs
+
+# On-demand request profiling. Enabled sirf do tarah: staff user `X-Profile: 1`
+# header bheje, ya SAMPLE_RATE fraction ke random requests. Baaki requests pe
+# middleware sirf ek header lookup + ek float compare karta hai.
+# Profiler stack sampler hai (background thread har INTERVAL pe request thread
+# ka stack padhta hai): gthread workers me concurrent requests pe bhi chalta
+# hai aur seedha collapsed stacks deta hai (flamegraph.pl / speedscope).
+
+DEFAULTS = {
+    "SAMPLE_RATE": 0.0,      # 0.01 = 1% requests
+    "HEADER": "X-Profile",
+    "INTERVAL": 0.005,       # seconds between stack samples
+    "MAX_DEPTH": 128,
+    "SLOW_QUERIES": 20,      # itni slowest queries store
+    "MAX_PROFILES": 500,
+    "RETENTION_DAYS": 7,
+}
+
+
+def _config():
+    conf = dict(DEFAULTS)
+    conf.update(getattr(settings, "PROFILING", {}))
+    return conf
+
+
+def trigger_for(request, conf):
+    """'header' / 'sample' / None. request.user sirf header aaye tab touch hota hai."""
+    if request.headers.get(conf["HEADER"]):
+        user = getattr(request, "user", None)
+        if user is not None and user.is_staff:
+            return "header"
+    if conf["SAMPLE_RATE"] and random.random() < conf["SAMPLE_RATE"]:
+        return "sample"
+    return None
+
+
+def _frame_label(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    def __init__(self, thread_id, interval, max_depth):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.max_depth = max_depth
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                stack.append(_frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+
+class SQLRecorder:
+    """connection.execute_wrapper() hook: har query ka time."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append((sql, time.perf_counter() - start))
+
+
+def top_functions(stacks, limit=30):
+    # Self samples: har stack ka leaf frame
+    own = Counter()
+    for stack, count in stacks.items():
+        own[stack.rsplit(";", 1)[-1]] += count
+    total = sum(own.values()) or 1
+    return "\n".join(f"{count:6d}  {count * 100 / total:5.1f}%  {label}" for label, count in own.most_common(limit))
+
+
+def collapsed(stacks):
+    return "\n".join(f"{stack} {count}" for stack, count in stacks.most_common())
+
+
+def save_profile(data):
+    from main.models import RequestProfile
+
+    RequestProfile.objects.create(**data)
+    prune()
+
+
+def prune():
+    from main.models import RequestProfile
+
+    conf = _config()
+    RequestProfile.objects.filter(created_at__lt=timezone.now() - timedelta(days=conf["RETENTION_DAYS"])).delete()
+    keep_from = (
+        RequestProfile.objects.order_by("-id").values_list("id", flat=True)[conf["MAX_PROFILES"]:conf["MAX_PROFILES"] + 1]
+    )
+    if keep_from:
+        RequestProfile.objects.filter(id__lte=keep_from[0]).delete()
+
+
+def store(request, response, trigger, duration, sampler, sql, conf):
+    match = request.resolver_match
+    user = getattr(request, "user", None)
+    slow = sorted(sql.queries, key=lambda q: q[1], reverse=True)[:conf["SLOW_QUERIES"]]
+    data = {
+        "user_id": user.pk if user is not None and user.is_authenticated else None,
+        "method": request.method,
+        "path": request.path[:255],
+        "url_name": (match.url_name or "") if match else "",
+        "trigger": trigger,
+        "status_code": response.status_code,
+        "duration_ms": duration * 1000,
+        "sql_count": len(sql.queries),
+        "sql_ms": sum(t for _, t in sql.queries) * 1000,
+        "samples": sum(sampler.stacks.values()),
+        "top_functions": top_functions(sampler.stacks),
+        "slow_queries": [{"ms": round(t * 1000, 3), "sql": q[:2000]} for q, t in slow],
+        "collapsed_stacks": collapsed(sampler.stacks),
+    }
+    # DB write response ke raaste me nahi
+    jobs.submit(save_profile, data)
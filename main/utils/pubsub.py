@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Pub/sub for live updates. LocalBackend sirf isi process ke subscribers tak
+# pahunchata hai; agar web (WSGI) aur stream (ASGI) alag processes hain to
+# RedisBackend set karo (PUBSUB_BACKEND), wo har process ke local subscribers
+# tak message fan-out karta hai.
+
+QUEUE_SIZE = 100
+RECONNECT_MIN_DELAY = 1    # seconds
+RECONNECT_MAX_DELAY = 30
+
+
+class Subscription:
+    """One listener: an asyncio.Queue bound to the loop it was created on."""
+
+    def __init__(self, backend, channel):
+        self.backend = backend
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.overflowed = False
+
+    def deliver(self, message):
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Slow client: stream band kar denge, EventSource reconnect karega
+            self.overflowed = True
+
+    async def get(self):
+        return await self.queue.get()
+
+    def close(self):
+        self.backend.unsubscribe(self)
+
+
+class LocalBackend:
+    def __init__(self):
+        self._subs = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel):
+        sub = Subscription(self, channel)
+        with self._lock:
+            self._subs[channel].add(sub)
+        return sub
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            subs = self._subs.get(sub.channel)
+            if subs is not None:
+                subs.discard(sub)
+                if not subs:
+                    del self._subs[sub.channel]
+
+    def subscriber_count(self, channel=None):
+        with self._lock:
+            if channel is not None:
+                return len(self._subs.get(channel, ()))
+            return sum(len(s) for s in self._subs.values())
+
+    def has_subscribers(self, channel):
+        return self.subscriber_count(channel) > 0
+
+    def publish(self, channel, message):
+        # Kisi bhi thread se call ho sakta hai (sync view / signal)
+        with self._lock:
+            subs = list(self._subs.get(channel, ()))
+        for sub in subs:
+            try:
+                sub.loop.call_soon_threadsafe(sub.deliver, message)
+            except RuntimeError:
+                # loop band ho chuka (server reload), stale subscriber
+                self.unsubscribe(sub)
+        return len(subs)
+
+
+class RedisBackend(LocalBackend):
+    PREFIX = "helpdesk:pubsub:"
+
+    def __init__(self):
+        super().__init__()
+        try:
+            import redis
+        except ImportError as e:
+            raise ImproperlyConfigured("RedisBackend needs the 'redis' package") from e
+        url = getattr(settings, "PUBSUB_REDIS_URL", None)
+        if not url:
+            raise ImproperlyConfigured("RedisBackend needs PUBSUB_REDIS_URL")
+        self._redis = redis.Redis.from_url(url)
+        self._redis_errors = (redis.ConnectionError, redis.TimeoutError)
+        self._listener = None
+
+    def subscribe(self, channel):
+        self._ensure_listener()
+        return super().subscribe(channel)
+
+    def has_subscribers(self, channel):
+        # Subscribers doosre processes me bhi ho sakte hain, yahan se pata nahi
+        return True
+
+    def publish(self, channel, message):
+        return self._redis.publish(self.PREFIX + channel, message)
+
+    def _ensure_listener(self):
+        # Har process me ek hi Redis subscription, local subscribers ko fan-out
+        with self._lock:
+            if self._listener is not None:
+                return
+            self._listener = threading.Thread(target=self._listen, name="pubsub-redis", daemon=True)
+            self._listener.start()
+
+    def _listen(self):
+        # Connection drop pe backoff ke saath dobara subscribe; thread kisi
+        # aur wajah se mare to _listener reset, agla subscribe() naya start kare
+        delay = RECONNECT_MIN_DELAY
+        try:
+            while True:
+                try:
+                    pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+                    pubsub.psubscribe(self.PREFIX + "*")
+                    delay = RECONNECT_MIN_DELAY
+                    for item in pubsub.listen():
+                        channel = item["channel"].decode()[len(self.PREFIX):]
+                        message = item["data"].decode()
+                        LocalBackend.publish(self, channel, message)
+                except self._redis_errors:
+                    logger.warning("pubsub: redis connection lost, retrying in %ss", delay)
+                    time.sleep(delay)
+                    delay = min(delay * 2, RECONNECT_MAX_DELAY)
+        except Exception:
+            logger.exception("pubsub: redis listener stopped")
+        finally:
+            with self._lock:
+                self._listener = None
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            path = getattr(settings, "PUBSUB_BACKEND", "main.utils.pubsub.LocalBackend")
+            _backend = import_string(path)()
+        return _backend
+
+
+def publish(channel, message):
+    try:
+        return get_backend().publish(channel, message)
+    except Exception:
+        # Live update fail hone se comment post fail nahi hona chahiye
+        logger.exception("pubsub publish to %s failed", channel)
+        return 0
+
+
+def has_subscribers(channel):
+    return get_backend().has_subscribers(channel)
+
+
+def subscribe(channel):
+    return get_backend().subscribe(channel)
@@ -0,0 +1,139 @@
+import logging
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from main.models import OTP, ArchivedComment, ArchivedQuestion, Comment, Profile, Question
+
+logger = logging.getLogger(__name__)
+
+# Soft-deleted rows ka asli cascade delete, chhote batches me (har batch
+# apni transaction), taaki ek prolific user ka delete bhi lambe lock na le.
+# Rows ke saath unki media files bhi storage se hata di jaati hain.
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_PROFILE_PICTURE = "profile_pics/default.png"
+
+
+def _delete_files_on_commit(fieldfiles):
+    names = [(f.storage, f.name) for f in fieldfiles if f and f.name and f.name != DEFAULT_PROFILE_PICTURE]
+    if not names:
+        return
+
+    def _delete():
+        for storage, name in names:
+            try:
+                storage.delete(name)
+            except OSError:
+                logger.warning("purge: could not delete media file %s", name)
+
+    transaction.on_commit(_delete)
+
+
+def soft_delete_user(user):
+    """Mark a user and everything they wrote as deleted (no row-by-row cascade)."""
+    now = timezone.now()
+    with transaction.atomic():
+        # soft_delete() signals bhejta hai (tag counts, live comments)
+        Question.objects.filter(user=user).soft_delete()
+        Comment.objects.filter(author=user).soft_delete()
+        type(user).objects.filter(pk=user.pk).update(deleted_at=now, is_active=False)
+
+
+def _purge_comments(batch_size):
+    with transaction.atomic():
+        batch = list(Comment.all_objects.filter(deleted_at__isnull=False).only("id", "file")[:batch_size])
+        if not batch:
+            return 0
+        Comment.all_objects.filter(id__in=[c.id for c in batch]).delete()
+        _delete_files_on_commit(c.file for c in batch)
+    return len(batch)
+
+
+def _purge_questions(batch_size):
+    # Question ke live comments bhi jaane hain; pehle unhe batch me hatao
+    question_ids = list(
+        Question.all_objects.filter(deleted_at__isnull=False).values_list("id", flat=True)[:batch_size]
+    )
+    if not question_ids:
+        return 0
+
+    with transaction.atomic():
+        comments = list(Comment.all_objects.filter(question_id__in=question_ids).only("id", "file")[:batch_size])
+        if comments:
+            Comment.all_objects.filter(id__in=[c.id for c in comments]).delete()
+            _delete_files_on_commit(c.file for c in comments)
+            return len(comments)
+
+        questions = list(Question.all_objects.filter(id__in=question_ids).only("id", "file"))
+        Question.all_objects.filter(id__in=question_ids).delete()
+        _delete_files_on_commit(q.file for q in questions)
+    return len(questions)
+
+
+def _purge_archived(user, batch_size):
+    # Archive tables me soft delete nahi; user ke archived threads (aur un pe
+    # doosron ke comments) seedhe batch me, user row ke cascade se pehle
+    comments = list(
+        ArchivedComment.objects.filter(Q(author=user) | Q(question__user=user)).only("id", "file")[:batch_size]
+    )
+    if comments:
+        ArchivedComment.objects.filter(id__in=[c.id for c in comments]).delete()
+        _delete_files_on_commit(c.file for c in comments)
+        return len(comments)
+
+    questions = list(ArchivedQuestion.objects.filter(user=user).only("id", "file")[:batch_size])
+    if questions:
+        ArchivedQuestion.objects.filter(id__in=[q.id for q in questions]).delete()
+        _delete_files_on_commit(q.file for q in questions)
+    return len(questions)
+
+
+def _purge_users(batch_size):
+    User = get_user_model()
+    done = 0
+    for user in User.objects.filter(deleted_at__isnull=False).only("id")[:batch_size]:
+        # Bacha hua content (mark ke baad likha gaya) pehle mark karo, agle pass me jaayega
+        if Question.all_objects.filter(user=user).exists() or Comment.all_objects.filter(author=user).exists():
+            done += Question.all_objects.filter(user=user, deleted_at__isnull=True).update(deleted_at=timezone.now())
+            done += Comment.all_objects.filter(author=user, deleted_at__isnull=True).update(deleted_at=timezone.now())
+            continue
+
+        with transaction.atomic():
+            archived = _purge_archived(user, batch_size)
+            if archived:
+                done += archived
+                continue
+
+            otp_ids = list(OTP.objects.filter(user=user).values_list("id", flat=True)[:batch_size])
+            if otp_ids:
+                OTP.objects.filter(id__in=otp_ids).delete()
+                done += len(otp_ids)
+                continue
+
+            profile = Profile.objects.filter(user=user).only("id", "profile_picture").first()
+            if profile:
+                _delete_files_on_commit([profile.profile_picture])
+            # Ab sirf chhoti rows bachi hain (profile), cascade sasta hai
+            User.objects.filter(pk=user.pk).delete()
+            done += 1
+    return done
+
+
+def purge_deleted(batch_size=DEFAULT_BATCH_SIZE, max_batches=None):
+    """Hard-delete soft-deleted rows batch by batch. Returns rows deleted."""
+    total = batches = 0
+    steps = [_purge_comments, _purge_questions, _purge_users]
+    while max_batches is None or batches < max_batches:
+        deleted = 0
+        for step in steps:
+            deleted += step(batch_size)
+            batches += 1
+        if not deleted:
+            break
+        total += deleted
+    if total:
+        logger.info("purge: %s rows deleted in %s batches", total, batches)
+    return total
@@ -1,22 +1,57 @@
+from django.conf import settings
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth import login, authenticate, logout
 from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib import messages
 from django.core.mail import send_mail
 from django.utils import timezone
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 from django.http import HttpResponseForbidden, JsonResponse
 from django.views.decorators.http import require_http_methods
 import random
+import time
 
-from .models import OTP, CustomUser, Question, Comment, Profile
-from .forms import SignupForm, OTPForm, QuestionForm, CommentForm, ProfileUpdateForm
+from .models import OTP, CustomUser, Question, Comment, Profile, Notification, ArchivedQuestion, Tag
+from .forms import SignupForm, OTPForm, QuestionForm, CommentForm, ProfileUpdateForm, SPAM_MESSAGE
+from . import archive, hot, moderation, notifications, tags
+from .utils import bulkhead, jobs, login_throttle, purge
 
 
 # Home Page
 def home(request):
-    questions = Question.objects.order_by('-created_at')[:10]
-    return render(request, 'home.html', {'questions': questions})
+    questions = Question.objects.select_related('user').prefetch_related('tags').order_by('-created_at')[:10]
+    return render(request, 'home.html', {
+        'questions': questions,
+        'hot_questions': hot.top(),
+        'tag_cloud': tags.tag_cloud(),
+    })
+
+
+# Tag Listing (keyset pagination on question id)
+TAG_PAGE_SIZE = 20
+
+
+def tag_detail(request, slug):
+    tag = get_object_or_404(Tag, slug=slug)
+    questions = (
+        Question.objects.filter(tag_links__tag=tag)
+        .select_related('user')
+        .prefetch_related('tags')
+        .order_by('-id')
+    )
+    before = request.GET.get('before')
+    if before and before.isdigit():
+        questions = questions.filter(id__lt=int(before))
+
+    page = list(questions[:TAG_PAGE_SIZE + 1])
+    next_before = page[TAG_PAGE_SIZE - 1].id if len(page) > TAG_PAGE_SIZE else None
+    return render(request, 'tag_detail.html', {
+        'tag': tag,
+        'questions': page[:TAG_PAGE_SIZE],
+        'next_before': next_before,
+        'tag_cloud': tags.tag_cloud(),
+    })
 
 
 # Signup View
@@ -113,11 +148,24 @@ def login_view(request):
     if request.method == 'POST':
         uname = request.POST['username']
         pwd = request.POST['password']
+
+        # Locked-out attempt ko hasher tak jaane hi mat do
+        wait = login_throttle.check(request, uname)
+        if wait:
+            messages.error(request, f'Too many login attempts. Try again in {wait} seconds.')
+            response = render(request, 'login.html', status=429)
+            response['Retry-After'] = str(wait)
+            return response
+
+        started = time.perf_counter()
         user = authenticate(request, username=uname, password=pwd)
+        login_throttle.record_hash_time(time.perf_counter() - started)
         if user:
+            login_throttle.reset(request, uname)
             login(request, user)
             return redirect('home')
         else:
+            login_throttle.register_failure(request, uname)
             messages.error(request, 'Invalid credentials')
 
     return render(request, 'login.html')
@@ -129,57 +177,104 @@ def logout_view(request):
     return redirect('home')
 
 
+def rate_limit_error(form, wait):
+    form.add_error(None, f"You're posting too fast. Please wait {wait} seconds and try again.")
+
+
 # Ask Question
 @login_required
 def ask_question(request):
+    status = 200
     if request.method == 'POST':
         form = QuestionForm(request.POST, request.FILES)
-        if form.is_valid():
+        # Spam/rate checks write se pehle (form.clean me blocklist)
+        wait = moderation.rate_limited(request.user, 'question')
+        if wait:
+            rate_limit_error(form, wait)
+            status = 429
+        elif form.is_valid():
             question = form.save(commit=False)
             question.user = request.user
             question.author = request.user
             question.save()
+            tags.set_question_tags(question, form.cleaned_data.get('tags'))
+            moderation.record_post(request.user, 'question')
             return redirect('home')
     else:
         form = QuestionForm()
-    return render(request, 'ask_question.html', {'form': form})
+    return render(request, 'ask_question.html', {'form': form}, status=status)
 
 
 # View Question + Comments
 def view_question(request, id):
-    question = get_object_or_404(Question, id=id)
-    comments = Comment.objects.filter(question=question).order_by('-created_at')
+    question = Question.objects.filter(id=id).first()
+    archived = None
+    if question is None:
+        # Hot table me nahi mila to archive se padho
+        archived = get_object_or_404(ArchivedQuestion.objects.select_related('user'), id=id)
 
+    status = 200
     if request.method == 'POST':
-        if request.user.is_authenticated:
-            form = CommentForm(request.POST, request.FILES)
-            if form.is_valid():
-                comment = form.save(commit=False)
-                comment.question = question
-                comment.author = request.user
-                comment.save()
-                return redirect('view_question', id=id)
-        else:
+        if not request.user.is_authenticated:
             return redirect('login')
+        form = CommentForm(request.POST, request.FILES)
+        # Spam/rate checks kisi bhi write (archive restore bhi) se pehle
+        wait = moderation.rate_limited(request.user, 'comment')
+        if wait:
+            rate_limit_error(form, wait)
+            status = 429
+        elif form.is_valid():
+            if archived is not None:
+                # Archived thread pe comment: thread pehle wapas hot tables me
+                question = archive.restore_thread(archived)
+            comment = form.save(commit=False)
+            comment.question = question
+            comment.author = request.user
+            try:
+                with transaction.atomic():
+                    comment.save()
+            except IntegrityError:
+                # archive_threads ne isi beech thread move kar diya: restore karke dobara
+                comment.question = archive.restore_thread(get_object_or_404(ArchivedQuestion, id=id))
+                comment.save()
+            moderation.record_post(request.user, 'comment')
+            return redirect('view_question', id=id)
     else:
         form = CommentForm()
+        if archived is None:
+            hot.record_view(question.id)
+
+    if archived is not None:
+        return render(request, 'view_question.html', {
+            'question': archived,
+            'comments': archived.comments.select_related('author').order_by('-created_at'),
+            'form': form,
+            'archived': True,
+        }, status=status)
 
     return render(request, 'view_question.html', {
         'question': question,
-        'comments': comments,
-        'form': form
-    })
+        'comments': Comment.objects.filter(question=question).order_by('-created_at'),
+        'form': form,
+        'live_updates': settings.REALTIME_ENABLED,
+    }, status=status)
 
 
 # Search Questions
 def search_questions(request):
     query = request.GET.get('q')
+    include_archived = request.GET.get('archived') == '1'
     results = []
     if query:
-        results = Question.objects.filter(
-            Q(title__icontains=query) | Q(body__icontains=query)
-        )
-    return render(request, 'search_results.html', {'results': results, 'query': query})
+        match = Q(title__icontains=query) | Q(body__icontains=query)
+        results = list(Question.objects.filter(match).select_related('user'))
+        if include_archived:
+            results += list(ArchivedQuestion.objects.filter(match).select_related('user'))
+    return render(request, 'search_results.html', {
+        'results': results,
+        'query': query,
+        'include_archived': include_archived,
+    })
 
 
 # Delete Question File
@@ -201,7 +296,9 @@ def delete_question_file(request, id):
 def delete_question(request, pk):
     question = get_object_or_404(Question, pk=pk)
     if request.user == question.user or request.user.is_superuser:
-        question.delete()
+        # Turant soft-delete; comments + files ka cascade background me
+        Question.objects.filter(pk=question.pk).soft_delete()
+        jobs.submit(purge.purge_deleted)
         messages.success(request, "Post deleted successfully!")
         return redirect('home')
     else:
@@ -212,13 +309,23 @@ def delete_question(request, pk):
 # Delete User (Admin only)
 @user_passes_test(lambda u: u.is_superuser)
 def delete_user(request, user_id):
-    from django.contrib.auth.models import User
-    user = get_object_or_404(User, id=user_id)
-    user.delete()
+    user = get_object_or_404(CustomUser, id=user_id, deleted_at__isnull=True)
+    purge.soft_delete_user(user)
+    jobs.submit(purge.purge_deleted)
     messages.success(request, "User deleted successfully!")
     return redirect('home')
 
 
+# Metrics (Admin only)
+@user_passes_test(lambda u: u.is_superuser)
+def metrics(request):
+    return JsonResponse({
+        "login_throttle": login_throttle.get_stats(),
+        "bulkheads": bulkhead.get_stats(),
+        "moderation": moderation.get_stats(),
+    })
+
+
 # Edit Question
 @login_required
 def edit_question(request, pk):
@@ -229,6 +336,21 @@ def edit_question(request, pk):
         return redirect('view_question', id=question.pk)
 
     if request.method == 'POST':
+        # Edit bhi ask jaisa hi moderate hota hai (warna clean post ke baad spam edit)
+        wait = moderation.rate_limited(request.user, 'edit')
+        if wait:
+            error, status = f"You're posting too fast. Please wait {wait} seconds and try again.", 429
+        elif moderation.find_blocked(request.POST.get('title'), request.POST.get('description'), request.POST.get('tags')):
+            error, status = SPAM_MESSAGE, 400
+        else:
+            error = None
+        if error:
+            return render(request, 'edit_question.html', {
+                'question': question,
+                'tag_text': request.POST.get('tags', ''),
+                'error': error,
+            }, status=status)
+
         question.title = request.POST.get('title')
         question.body = request.POST.get('description')
 
@@ -238,10 +360,13 @@ def edit_question(request, pk):
             question.file = request.FILES['file']
 
         question.save()
+        if 'tags' in request.POST:
+            tags.set_question_tags(question, request.POST.get('tags'))
+        moderation.record_post(request.user, 'edit')
         messages.success(request, "Post updated successfully!")
         return redirect('view_question', id=question.pk)
 
-    return render(request, 'edit_question.html', {'question': question})
+    return render(request, 'edit_question.html', {'question': question, 'tag_text': tags.tag_text(question)})
 
 
 # Edit Comment
@@ -252,15 +377,21 @@ def edit_comment(request, comment_id):
     if request.user != comment.author and not request.user.is_superuser:
         return redirect('view_question', id=comment.question.id)
 
+    status = 200
     if request.method == "POST":
         form = CommentForm(request.POST, request.FILES, instance=comment)
-        if form.is_valid():
+        wait = moderation.rate_limited(request.user, 'edit')
+        if wait:
+            rate_limit_error(form, wait)
+            status = 429
+        elif form.is_valid():
             form.save()
+            moderation.record_post(request.user, 'edit')
             return redirect('view_question', id=comment.question.id)
     else:
         form = CommentForm(instance=comment)
 
-    return render(request, 'edit_comment.html', {'form': form, 'comment': comment})
+    return render(request, 'edit_comment.html', {'form': form, 'comment': comment}, status=status)
 
 
 # Delete Comment
@@ -271,8 +402,9 @@ def delete_comment(request, comment_id):
     if request.user != comment.author and not request.user.is_superuser:
         return redirect('view_question', id=comment.question.id)
 
-    question_id = comment.question.id
-    comment.delete()
+    question_id = comment.question_id
+    Comment.objects.filter(pk=comment.pk).soft_delete()
+    jobs.submit(purge.purge_deleted)
     messages.success(request, "Comment deleted successfully!")
     return redirect('view_question', id=question_id)
 
@@ -308,6 +440,30 @@ def remove_profile_pic(request):
     return redirect("profile")
 
 
+# Notifications Inbox
+@login_required
+def notification_list(request):
+    if request.method == "POST":
+        notifications.mark_read(request.user.pk)
+        return redirect("notifications")
+
+    items = (
+        Notification.objects.filter(user=request.user, question__deleted_at__isnull=True)
+        .select_related("question", "last_comment__author")
+        .order_by("read_at", "-updated_at")[:50]
+    )
+    return render(request, "notifications.html", {"items": items})
+
+
+# Open Notification (mark read + go to thread)
+@login_required
+def open_notification(request, pk):
+    item = get_object_or_404(Notification, pk=pk, user=request.user)
+    if item.read_at is None:
+        notifications.mark_read(request.user.pk, [item.pk])
+    return redirect("view_question", id=item.question_id)
+
+
 # AI Suggestion View
 @require_http_methods(["GET", "POST"])
 def ai_suggest(request, question_id):
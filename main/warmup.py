@@ -0,0 +1,117 @@
+import logging
+import os
+import time
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Worker warm-up: jo kaam Django pehli request pe lazily karta hai (URL
+# resolver, template compile, heavy imports) wo yahin pehle kar lo.
+# Gunicorn preload_app ke saath ye master me ek baar chalta hai aur
+# har forked worker ko warm state milti hai.
+
+
+def warm_imports():
+    # get_ai_answer openai ko lazily import karta hai; sys.modules me daal do
+    try:
+        import openai  # noqa: F401
+    except ImportError:
+        pass
+
+
+def warm_urls():
+    from django.urls import get_resolver, reverse
+
+    resolver = get_resolver()
+    resolver.url_patterns
+    # reverse dict bhi populate ho jaaye ({% url %} tags ke liye)
+    reverse("home")
+
+
+def warm_templates():
+    from django.template import engines
+    from django.template.loader import get_template
+
+    # Cached loader compile kiye hue templates process me rakhta hai
+    names = set()
+    for engine in engines.all():
+        for template_dir in engine.template_dirs:
+            if not os.path.isdir(template_dir):
+                continue
+            for root, _dirs, files in os.walk(template_dir):
+                for filename in files:
+                    if filename.endswith(".html"):
+                        path = os.path.join(root, filename)
+                        names.add(os.path.relpath(path, template_dir))
+
+    for name in sorted(names):
+        try:
+            get_template(name)
+        except Exception:
+            logger.exception("warm-up: could not compile template %s", name)
+    return len(names)
+
+
+def warm_cache():
+    # Redis/memcached connection pehli request se pehle khul jaaye
+    from django.core.cache import caches
+
+    for alias in settings.CACHES:
+        caches[alias].get("warmup:ping")
+
+
+def open_db_connections():
+    from django.db import connections
+
+    for conn in connections.all():
+        conn.ensure_connection()
+
+
+def close_db_connections():
+    from django.db import connections
+
+    for conn in connections.all():
+        conn.close()
+
+
+# Process-shared steps (fork se pehle safe hain)
+SHARED_STEPS = [
+    ("imports", warm_imports),
+    ("urls", warm_urls),
+    ("templates", warm_templates),
+]
+
+# Sockets wale steps har worker me alag (fork ke baad)
+PER_WORKER_STEPS = [
+    ("cache", warm_cache),
+    ("db", open_db_connections),
+]
+
+
+def run(steps):
+    timings = {}
+    for name, step in steps:
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception:
+            logger.exception("warm-up step %s failed", name)
+        timings[name] = time.perf_counter() - started
+    logger.info(
+        "warm-up done: %s",
+        ", ".join(f"{name}={secs * 1000:.1f}ms" for name, secs in timings.items()),
+    )
+    return timings
+
+
+def warm_up_shared():
+    return run(SHARED_STEPS)
+
+
+def warm_up_worker(db=True):
+    # Django DB connections per thread hoti hain: sirf sync workers me request
+    # usi main thread pe chalti hai jisne connection khola. gthread/uvicorn me
+    # ye connection kabhi use nahi hota, bas idle pada rehta, to skip karo
+    steps = PER_WORKER_STEPS if db else [(name, step) for name, step in PER_WORKER_STEPS if name != "db"]
+    return run(steps)